@@ -1,6 +1,20 @@
 """LangGraph agent core for skill-based execution."""
 
-from skillslike.agent.core import create_agent
-from skillslike.agent.state import AgentState
+from skillslike.agent.core import (
+    ainvoke_agent,
+    aseed_thread,
+    astream_agent,
+    create_agent,
+    invoke_agent,
+)
+from skillslike.agent.state import AgentResult, AgentState
 
-__all__ = ["create_agent", "AgentState"]
+__all__ = [
+    "create_agent",
+    "invoke_agent",
+    "ainvoke_agent",
+    "astream_agent",
+    "aseed_thread",
+    "AgentResult",
+    "AgentState",
+]
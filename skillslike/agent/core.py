@@ -1,19 +1,178 @@
 """Core agent implementation using LangGraph."""
 
 import logging
-from typing import Literal
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Sequence
+from functools import lru_cache
+from typing import Any, Literal
 
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langchain_core.tools import StructuredTool
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import ToolNode
 
-from skillslike.agent.state import AgentState
+from skillslike.agent.state import AgentResult, AgentState
+from skillslike.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Tool outputs reference generated files as `file_id: <id>`
+_FILE_ID_RE = re.compile(r"file_id:\s*(\S+)")
+
+
+class _ThreadKeys:
+    """Keys a thread occupies in `MemorySaver.writes` and `MemorySaver.blobs`."""
+
+    __slots__ = ("blobs", "writes")
+
+    def __init__(self) -> None:
+        """Initialize empty key sets."""
+        self.writes: set[tuple[str, str, str]] = set()
+        self.blobs: set[tuple[str, str, str, str | int | float]] = set()
+
+
+class _BoundedMemorySaver(MemorySaver):
+    """`MemorySaver` that only keeps the most recently written threads.
+
+    Every stateless chat request gets a fresh thread, so an unbounded saver
+    grows for the lifetime of the process. Once `max_threads` is exceeded the
+    least recently written thread is deleted. The keys each thread adds are
+    tracked, so eviction only touches that thread's entries instead of
+    scanning every checkpoint like `delete_thread`.
+    """
+
+    def __init__(self, max_threads: int) -> None:
+        """Initialize the saver.
+
+        Args:
+            max_threads: Maximum number of threads to keep.
+        """
+        super().__init__()
+        self._max_threads = max_threads
+        # thread_id -> its keys, least recently written first
+        self._threads: OrderedDict[str, _ThreadKeys] = OrderedDict()
+        self._threads_lock = threading.Lock()
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint and evict the oldest threads over the limit.
+
+        Args:
+            config: The config to associate with the checkpoint.
+            checkpoint: The checkpoint to save.
+            metadata: Additional metadata to save with the checkpoint.
+            new_versions: New channel versions as of this write.
+
+        Returns:
+            Updated config containing the saved checkpoint's ID.
+        """
+        result = super().put(config, checkpoint, metadata, new_versions)
+
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        evicted: list[tuple[str, _ThreadKeys]] = []
+        with self._threads_lock:
+            keys = self._thread_keys(thread_id)
+            self._threads.move_to_end(thread_id)
+            keys.blobs.update((thread_id, checkpoint_ns, k, v) for k, v in new_versions.items())
+            while len(self._threads) > self._max_threads:
+                evicted.append(self._threads.popitem(last=False))
+
+        for old_thread_id, old_keys in evicted:
+            logger.debug("Evicting checkpointed thread %s", old_thread_id)
+            self.storage.pop(old_thread_id, None)
+            for write_key in old_keys.writes:
+                self.writes.pop(write_key, None)
+            for blob_key in old_keys.blobs:
+                self.blobs.pop(blob_key, None)
+
+        return result
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Save intermediate writes and record their key for eviction.
+
+        Args:
+            config: The config of the checkpoint the writes belong to.
+            writes: The writes to save.
+            task_id: Identifier for the task creating the writes.
+            task_path: Path of the task creating the writes.
+        """
+        super().put_writes(config, writes, task_id, task_path)
+
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        with self._threads_lock:
+            keys = self._thread_keys(thread_id)
+            keys.writes.add((thread_id, checkpoint_ns, configurable["checkpoint_id"]))
+
+    def _thread_keys(self, thread_id: str) -> _ThreadKeys:
+        """Get the tracked keys of a thread, adding it if new.
+
+        Must be called with `_threads_lock` held.
+
+        Args:
+            thread_id: Thread ID.
+
+        Returns:
+            The thread's key sets.
+        """
+        keys = self._threads.get(thread_id)
+        if keys is None:
+            keys = self._threads[thread_id] = _ThreadKeys()
+        return keys
+
+
+# Shared by all cached agents so a thread keeps its history regardless of
+# which tool subset the router picks for a given turn. The history lives in
+# this process only: thread continuity needs a single API worker (or a shared
+# checkpointer passed to `create_agent`).
+_default_checkpointer = _BoundedMemorySaver(max_threads=get_settings().checkpoint_max_threads)
+
+_AGENT_CACHE_SIZE = 64
+_agent_cache: dict[tuple[Any, ...], StateGraph] = {}
+
+
+@lru_cache(maxsize=64)
+def _get_model(model_name: str, base_url: str | None, api_key: str | None) -> ChatAnthropic:
+    """Get a pooled model client for the given configuration.
+
+    Reusing the instance keeps its underlying HTTP connection pool warm
+    across requests instead of paying a TCP/TLS handshake per chat turn.
+
+    Args:
+        model_name: Name of the Anthropic model to use.
+        base_url: Optional custom API base URL.
+        api_key: Optional API key.
+
+    Returns:
+        ChatAnthropic instance.
+    """
+    model_kwargs: dict[str, Any] = {"model": model_name, "temperature": 0}
+    if base_url:
+        model_kwargs["base_url"] = base_url
+    if api_key:
+        model_kwargs["api_key"] = api_key
+
+    return ChatAnthropic(**model_kwargs)
+
 
 def create_agent(
     tools_subset: list[StructuredTool],
@@ -30,16 +189,69 @@ def create_agent(
         tools_subset: List of tools to bind to the agent.
         model_name: Name of the Anthropic model to use.
         system_prompt: Optional system prompt for the agent.
-        checkpointer: Optional checkpointer for state persistence.
+        checkpointer: Optional checkpointer for state persistence. Defaults to
+            a process-wide in-memory saver bounded to the most recent
+            `checkpoint_max_threads` threads.
         base_url: Optional custom API base URL for third-party providers.
         api_key: Optional API key (defaults to environment variable).
 
     Returns:
         Compiled StateGraph ready for invocation.
+
+    Note:
+        Compiled graphs are cached per configuration and tool set, so repeated
+        calls with the same tools return the same graph.
     """
     if checkpointer is None:
-        checkpointer = MemorySaver()
+        checkpointer = _default_checkpointer
+
+    # Tool identity is part of the key so a registry reload (which builds new
+    # tool objects) never hits a graph bound to stale executors.
+    cache_key = (
+        model_name,
+        base_url,
+        api_key,
+        system_prompt,
+        id(checkpointer),
+        tuple(sorted((tool.name, id(tool)) for tool in tools_subset)),
+    )
+
+    app = _agent_cache.pop(cache_key, None)
+    if app is None:
+        app = _build_agent(
+            tools_subset,
+            model=_get_model(model_name, base_url, api_key),
+            system_prompt=system_prompt,
+            checkpointer=checkpointer,
+        )
+        if len(_agent_cache) >= _AGENT_CACHE_SIZE:
+            # Evict the least recently used entry
+            del _agent_cache[next(iter(_agent_cache))]
+    else:
+        logger.debug("Reusing cached agent graph")
+
+    _agent_cache[cache_key] = app
+    return app
+
+
+def _build_agent(
+    tools_subset: list[StructuredTool],
+    *,
+    model: ChatAnthropic,
+    system_prompt: str | None,
+    checkpointer: MemorySaver,
+) -> StateGraph:
+    """Build and compile the agent graph.
+
+    Args:
+        tools_subset: List of tools to bind to the agent.
+        model: Model client to bind the tools to.
+        system_prompt: Optional system prompt for the agent.
+        checkpointer: Checkpointer for state persistence.
 
+    Returns:
+        Compiled StateGraph ready for invocation.
+    """
     if system_prompt is None:
         system_prompt = (
             "You are a helpful assistant with access to specialized skills. "
@@ -47,21 +259,26 @@ def create_agent(
             "Maintain context across the conversation thread."
         )
 
-    # Initialize the model with optional custom base_url
-    model_kwargs = {"model": model_name, "temperature": 0}
-    if base_url:
-        model_kwargs["base_url"] = base_url
-    if api_key:
-        model_kwargs["api_key"] = api_key
-
-    model = ChatAnthropic(**model_kwargs)
-
     # Bind tools to the model
     if tools_subset:
         model = model.bind_tools(tools_subset)
         logger.info("Bound %d tools to model", len(tools_subset))
 
+    # The system prompt is not checkpointed, so it is prepended on every turn
+    system_msg = {"role": "system", "content": system_prompt}
+
     # Define graph nodes
+    def prepare_messages(state: AgentState) -> list[Any]:
+        """Get the model input for the current state.
+
+        Args:
+            state: Current agent state.
+
+        Returns:
+            Messages to send to the model.
+        """
+        return [system_msg, *state["messages"]]
+
     def call_model(state: AgentState) -> dict[str, list[AIMessage]]:
         """Call the LLM with the current state.
 
@@ -71,15 +288,24 @@ def create_agent(
         Returns:
             Dictionary with updated messages.
         """
-        messages = state["messages"]
+        response = model.invoke(prepare_messages(state))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Model response: %s", response.content[:100])
+
+        return {"messages": [response]}
 
-        # Add system prompt if this is the first message
-        if len(messages) == 1 and isinstance(messages[0], HumanMessage):
-            system_msg = {"role": "system", "content": system_prompt}
-            messages = [system_msg] + messages
+    async def acall_model(state: AgentState) -> dict[str, list[AIMessage]]:
+        """Call the LLM with the current state without blocking the event loop.
 
-        response = model.invoke(messages)
-        logger.debug("Model response: %s", response.content[:100])
+        Args:
+            state: Current agent state.
+
+        Returns:
+            Dictionary with updated messages.
+        """
+        response = await model.ainvoke(prepare_messages(state))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Model response: %s", response.content[:100])
 
         return {"messages": [response]}
 
@@ -96,46 +322,46 @@ def create_agent(
 
         # If the last message has tool calls, continue to tools
         if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-            logger.debug("Continuing to tools: %d calls", len(last_message.tool_calls))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Continuing to tools: %d calls", len(last_message.tool_calls))
             return "tools"
 
         # Otherwise, end
         logger.debug("No tool calls, ending")
         return "end"
 
-    def process_tool_output(state: AgentState) -> dict[str, list[str]]:
+    def process_tool_output(state: AgentState) -> dict[str, Any]:
         """Process tool outputs to extract file IDs.
 
+        Only messages added since the previous call are scanned.
+
         Args:
             state: Current agent state.
 
         Returns:
-            Dictionary with updated file_ids.
+            Dictionary with updated file_ids and scan position.
         """
-        file_ids = state.get("file_ids", [])
+        file_ids = list(state.get("file_ids", []))
+        seen = set(file_ids)
         messages = state["messages"]
+        start = state.get("last_scanned_index", 0)
 
-        # Extract file IDs from recent ToolMessages
-        for msg in reversed(messages):
-            if isinstance(msg, ToolMessage):
-                # Look for file_id in tool output
-                # Expected format: {"text": "...", "file_id": "..."}
-                if isinstance(msg.content, str) and "file_id:" in msg.content:
-                    # Simple extraction (can be improved)
-                    parts = msg.content.split("file_id:")
-                    if len(parts) > 1:
-                        file_id = parts[1].split()[0].strip()
-                        if file_id and file_id not in file_ids:
-                            file_ids.append(file_id)
-                            logger.info("Extracted file_id: %s", file_id)
-
-        return {"file_ids": file_ids}
+        # Extract file IDs from new ToolMessages
+        for msg in messages[start:]:
+            if isinstance(msg, ToolMessage) and isinstance(msg.content, str):
+                for file_id in _FILE_ID_RE.findall(msg.content):
+                    if file_id not in seen:
+                        seen.add(file_id)
+                        file_ids.append(file_id)
+                        logger.info("Extracted file_id: %s", file_id)
+
+        return {"file_ids": file_ids, "last_scanned_index": len(messages)}
 
     # Build the graph
     workflow = StateGraph(AgentState)
 
     # Add nodes
-    workflow.add_node("agent", call_model)
+    workflow.add_node("agent", RunnableLambda(call_model, afunc=acall_model, name="agent"))
 
     if tools_subset:
         # Create tool node
@@ -172,7 +398,7 @@ def invoke_agent(
     message: str,
     *,
     thread_id: str = "default",
-) -> dict[str, list[str] | str]:
+) -> AgentResult:
     """Invoke the agent with a message.
 
     Args:
@@ -181,29 +407,145 @@ def invoke_agent(
         thread_id: Thread ID for checkpointing.
 
     Returns:
-        Dictionary with `text` response and `file_ids` list.
+        Dictionary with `text` response, `file_ids` list, and whether the
+        turn `used_tools`.
     """
-    # Invoke the graph
     result = app.invoke(
         {"messages": [HumanMessage(content=message)], "file_ids": []},
         config={"configurable": {"thread_id": thread_id}},
     )
 
-    # Extract text from messages
+    return _parse_result(result)
+
+
+async def ainvoke_agent(
+    app: StateGraph,
+    message: str,
+    *,
+    thread_id: str = "default",
+) -> AgentResult:
+    """Invoke the agent with a message asynchronously.
+
+    Prefer this from async code: the model call and tool calls are awaited
+    instead of blocking the event loop for the whole LLM round-trip.
+
+    Args:
+        app: Compiled agent graph.
+        message: User message.
+        thread_id: Thread ID for checkpointing.
+
+    Returns:
+        Dictionary with `text` response, `file_ids` list, and whether the
+        turn `used_tools`.
+    """
+    result = await app.ainvoke(
+        {"messages": [HumanMessage(content=message)], "file_ids": []},
+        config={"configurable": {"thread_id": thread_id}},
+    )
+
+    return _parse_result(result)
+
+
+async def astream_agent(
+    app: StateGraph,
+    message: str,
+    *,
+    thread_id: str = "default",
+) -> AsyncIterator[dict[str, Any]]:
+    """Invoke the agent with a message, streaming the model output.
+
+    Args:
+        app: Compiled agent graph.
+        message: User message.
+        thread_id: Thread ID for checkpointing.
+
+    Yields:
+        `{"type": "token", "text": ...}` for each text delta from the model,
+        then a final `{"type": "done", "file_ids": [...]}`.
+    """
+    config = {"configurable": {"thread_id": thread_id}}
+
+    async for event in app.astream_events(
+        {"messages": [HumanMessage(content=message)], "file_ids": []},
+        config=config,
+        version="v2",
+    ):
+        if event["event"] != "on_chat_model_stream":
+            continue
+        if event.get("metadata", {}).get("langgraph_node") != "agent":
+            continue
+
+        text = _extract_text(event["data"]["chunk"].content)
+        if text:
+            yield {"type": "token", "text": text}
+
+    state = await app.aget_state(config)
+    yield {"type": "done", "file_ids": state.values.get("file_ids", [])}
+
+
+async def aseed_thread(app: StateGraph, message: str, reply: str, *, thread_id: str) -> None:
+    """Record a turn that was answered without running the agent.
+
+    Lets a follow-up message on `thread_id` see the exchange, e.g. when the
+    reply was served from a response cache.
+
+    Args:
+        app: Compiled agent graph sharing the target thread's checkpointer.
+        message: User message.
+        reply: Assistant reply to the message.
+        thread_id: Thread ID to record the turn on.
+    """
+    await app.aupdate_state(
+        {"configurable": {"thread_id": thread_id}},
+        {"messages": [HumanMessage(content=message), AIMessage(content=reply)]},
+        as_node="agent",
+    )
+
+
+def _extract_text(content: str | list[Any]) -> str:
+    """Extract the text from message content.
+
+    Args:
+        content: Message content, either a string or a list of content blocks.
+
+    Returns:
+        Concatenated text.
+    """
+    if isinstance(content, str):
+        return content
+
+    return "".join(
+        item.get("text", "")
+        for item in content
+        if isinstance(item, dict) and item.get("type") == "text"
+    )
+
+
+def _parse_result(result: dict[str, Any]) -> AgentResult:
+    """Extract the response text and file IDs from a graph result.
+
+    Args:
+        result: Final graph state.
+
+    Returns:
+        Dictionary with the latest assistant reply as `text`, the `file_ids`
+        list, and `used_tools` telling whether this turn ran any tool.
+    """
+    # The checkpointed history covers the whole thread; only the final reply
+    # of this turn is returned, so skip straight to the last AIMessage.
     messages = result.get("messages", [])
-    text_parts = []
-
-    for msg in messages:
-        if isinstance(msg, AIMessage):
-            if isinstance(msg.content, str):
-                text_parts.append(msg.content)
-            elif isinstance(msg.content, list):
-                # Handle structured content
-                for item in msg.content:
-                    if isinstance(item, dict) and item.get("type") == "text":
-                        text_parts.append(item.get("text", ""))
-
-    text = "\n".join(text_parts).strip()
+    last_ai = next((m for m in reversed(messages) if isinstance(m, AIMessage)), None)
+
+    text = _extract_text(last_ai.content).strip() if last_ai else ""
     file_ids = result.get("file_ids", [])
 
-    return {"text": text, "file_ids": file_ids}
+    # This turn's messages are the ones after the latest user message
+    used_tools = False
+    for msg in reversed(messages):
+        if isinstance(msg, HumanMessage):
+            break
+        if isinstance(msg, ToolMessage):
+            used_tools = True
+            break
+
+    return {"text": text, "file_ids": file_ids, "used_tools": used_tools}
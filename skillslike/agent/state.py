@@ -12,7 +12,23 @@ class AgentState(TypedDict):
     Attributes:
         messages: The conversation messages with automatic merging.
         file_ids: List of file IDs generated by tools.
+        last_scanned_index: Number of messages already scanned for file IDs.
     """
 
     messages: Annotated[list[BaseMessage], add_messages]
     file_ids: list[str]
+    last_scanned_index: int
+
+
+class AgentResult(TypedDict):
+    """Result of one agent turn.
+
+    Attributes:
+        text: The final assistant reply.
+        file_ids: File IDs generated by tools on the thread.
+        used_tools: Whether any tool ran during the turn.
+    """
+
+    text: str
+    file_ids: list[str]
+    used_tools: bool
@@ -0,0 +1,81 @@
+"""In-memory response cache for the chat endpoint."""
+
+import logging
+from collections import OrderedDict
+
+from skillslike.agent.state import AgentResult
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """LRU cache of agent responses keyed by normalized message text.
+
+    Only meant for stateless requests (no `thread_id`), where the answer
+    depends on the message alone. Messages that differ only in case or
+    whitespace share an entry.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        """Initialize the response cache.
+
+        Args:
+            max_size: Maximum number of cached responses. `0` disables caching.
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[str, AgentResult] = OrderedDict()
+
+    @staticmethod
+    def normalize(message: str) -> str:
+        """Normalize a message into a cache key.
+
+        Args:
+            message: User message.
+
+        Returns:
+            Case-folded message with collapsed whitespace.
+        """
+        return " ".join(message.casefold().split())
+
+    def get(self, message: str) -> AgentResult | None:
+        """Get a cached response for a message.
+
+        Args:
+            message: User message.
+
+        Returns:
+            Cached result with `text` and `file_ids`, or `None` on a miss.
+        """
+        key = self.normalize(message)
+        result = self._entries.get(key)
+
+        if result is not None:
+            self._entries.move_to_end(key)
+            logger.debug("Response cache hit: %s", key[:50])
+
+        return result
+
+    def put(self, message: str, result: AgentResult) -> None:
+        """Cache a response for a message.
+
+        Args:
+            message: User message.
+            result: Agent result with `text` and `file_ids`.
+        """
+        if self.max_size <= 0:
+            return
+
+        key = self.normalize(message)
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Get the number of cached responses."""
+        return len(self._entries)
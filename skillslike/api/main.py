@@ -1,35 +1,61 @@
 """FastAPI application for the SkillsLike agent."""
 
+import asyncio
 import logging
 import os
+import secrets
+from collections.abc import AsyncIterator
 from pathlib import Path
-from uuid import uuid4
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from langgraph.graph import StateGraph
+from starlette.types import Receive, Scope, Send
 
-from skillslike.agent.core import create_agent, invoke_agent
+from skillslike.agent.core import ainvoke_agent, aseed_thread, astream_agent, create_agent
+from skillslike.agent.state import AgentResult
+from skillslike.api.cache import ResponseCache
 from skillslike.api.schemas import ChatRequest, ChatResponse, FileMetadata, HealthResponse
 from skillslike.config import get_settings
+from skillslike.executors.http import aclose_clients
 from skillslike.registry import SkillRegistry
 from skillslike.router import IntentRouter
 from skillslike.storage import FileStore
 
-# Configure logging
+# Configure logging (set LOG_LEVEL=WARNING in production to keep the hot path quiet)
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
 logger = logging.getLogger(__name__)
 
+
+class _GZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves file downloads alone.
+
+    Stored files are mostly already-compressed images, and compressing them
+    would also defeat `FileResponse`'s zero-copy sendfile path.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith("/api/file/"):
+            await self.app(scope, receive, send)
+            return
+
+        await super().__call__(scope, receive, send)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="SkillsLike Agent API",
     description="Agent architecture for skill-like progressive loading",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -41,25 +67,85 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON payloads such as verbose chat responses (SSE is excluded)
+app.add_middleware(_GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+class _AppState:
+    """Application components shared by the request handlers.
+
+    Components are replaced by assigning a fully built object (a single
+    reference store), so handlers never see a half-built router or registry.
+    Handlers should read each attribute once into a local.
+    """
+
+    registry: SkillRegistry | None = None
+    router: IntentRouter | None = None
+    file_store: FileStore | None = None
+
+    # Serialized /api/skills payload, rebuilt whenever the registry changes
+    skills_payload: bytes | None = None
+
+
 # Global state
-registry: SkillRegistry | None = None
-router: IntentRouter | None = None
-file_store: FileStore | None = None
+state = _AppState()
+response_cache = ResponseCache(get_settings().response_cache_size)
 
+# Frontend assets, resolved once at import
+_STATIC_DIR = Path("static")
+_INDEX_FILE = _STATIC_DIR / "index.html"
 
 # Mount static files
-try:
-    app.mount("/static", StaticFiles(directory="static"), name="static")
-except RuntimeError:
-    # Static directory doesn't exist, skip mounting
-    pass
+if _STATIC_DIR.is_dir():
+    app.mount("/static", StaticFiles(directory=_STATIC_DIR), name="static")
+
+
+def _serialize_skills(registry: SkillRegistry) -> bytes:
+    """Serialize the skill listing served by `/api/skills`.
+
+    Args:
+        registry: Skill registry to list.
+
+    Returns:
+        JSON payload.
+    """
+    return orjson.dumps(
+        [
+            {
+                "name": m.name,
+                "description": m.description,
+                "runtime": m.runtime.type,
+                "tags": ", ".join(m.tags),
+            }
+            for m in registry.get_all_manifests()
+        ]
+    )
+
+
+def _load_registry(skills_dir: str) -> SkillRegistry:
+    """Load the skill registry, falling back to an empty one.
+
+    Args:
+        skills_dir: Directory containing skill manifest files.
+
+    Returns:
+        Loaded skill registry.
+    """
+    try:
+        skill_registry = SkillRegistry(skills_dir)
+        logger.info("Loaded %d skills", len(skill_registry.manifests))
+    except ValueError as e:
+        logger.warning("Failed to load skills: %s", e)
+        # Create empty registry with fallback
+        Path(skills_dir).mkdir(parents=True, exist_ok=True)
+        skill_registry = SkillRegistry(skills_dir)
+
+    return skill_registry
 
 
 @app.on_event("startup")
 async def startup_event() -> None:
     """Initialize application on startup."""
-    global registry, router, file_store
-
     # Get configuration from environment
     skills_dir = os.getenv("SKILLS_DIR", "skills/")
 
@@ -72,30 +158,43 @@ async def startup_event() -> None:
 
     logger.info("Initializing SkillsLike Agent API")
 
-    # Initialize file store
-    file_store = FileStore(file_store_dir)
-
-    # Initialize registry
-    try:
-        registry = SkillRegistry(skills_dir)
-        logger.info("Loaded %d skills", len(registry.manifests))
-    except ValueError as e:
-        logger.warning("Failed to load skills: %s", e)
-        # Create empty registry with fallback
-        Path(skills_dir).mkdir(parents=True, exist_ok=True)
-        registry = SkillRegistry(skills_dir)
+    # Initialize file store and registry concurrently, off the event loop
+    file_store, registry = await asyncio.gather(
+        asyncio.to_thread(FileStore, file_store_dir),
+        asyncio.to_thread(_load_registry, skills_dir),
+    )
 
     # Initialize router
     manifests = registry.get_all_manifests()
-    router = IntentRouter(manifests, max_tools=5)
+    state.router = IntentRouter(manifests, max_tools=5)
+    state.skills_payload = _serialize_skills(registry)
+    state.registry = registry
+    state.file_store = file_store
+
+    # Pay model client setup and graph compilation once here, not on the first chat
+    base_url, api_key = _get_model_config()
+    try:
+        await asyncio.to_thread(create_agent, [], base_url=base_url, api_key=api_key)
+    except Exception as e:
+        logger.warning("Agent pre-warm failed: %s", e)
 
     logger.info("Application startup complete")
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Release pooled connections and the file store on shutdown."""
+    await aclose_clients()
+
+    if state.file_store is not None:
+        state.file_store.close()
+        state.file_store = None
+
+
 @app.get("/", include_in_schema=False)
 async def root() -> FileResponse:
     """Serve the frontend application."""
-    return FileResponse("static/index.html")
+    return FileResponse(_INDEX_FILE)
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -105,12 +204,93 @@ async def health_check() -> HealthResponse:
     Returns:
         Health status and loaded skills count.
     """
+    registry = state.registry
     skills_loaded = len(registry.manifests) if registry else 0
     return HealthResponse(status="healthy", skills_loaded=skills_loaded)
 
 
+def _create_chat_agent(
+    message: str,
+    registry: SkillRegistry,
+    router: IntentRouter,
+) -> StateGraph:
+    """Create an agent with the tools routed for a message.
+
+    Args:
+        message: User message.
+        registry: Skill registry providing the tools.
+        router: Router selecting the tools for the message.
+
+    Returns:
+        Compiled agent graph.
+    """
+    # Get all tools
+    all_tools = registry.get_all_tools()
+
+    # Route to relevant tools
+    selected_tools = router.route_tools(
+        message,
+        all_tools,
+        get_manifest=registry.get_manifest,
+    )
+
+    logger.info("Selected %d tools for this request", len(selected_tools))
+
+    # Create agent with selected tools and custom API config
+    base_url, api_key = _get_model_config()
+    return create_agent(selected_tools, base_url=base_url, api_key=api_key)
+
+
+def _get_model_config() -> tuple[str | None, str | None]:
+    """Determine which API endpoint the agent should use.
+
+    Returns:
+        Tuple of `(base_url, api_key)`; both `None` for the default Anthropic API.
+    """
+    # Get settings for API configuration
+    settings = get_settings()
+
+    # Determine which API to use
+    base_url = None
+    api_key = None
+
+    if settings.use_openai_compatible and settings.openai_base_url:
+        # Use OpenAI-compatible endpoint
+        base_url = settings.openai_base_url
+        api_key = settings.openai_api_key
+        logger.info("Using OpenAI-compatible API: %s", base_url)
+    elif settings.anthropic_base_url:
+        # Use custom Anthropic endpoint
+        base_url = settings.anthropic_base_url
+        api_key = settings.anthropic_api_key
+        logger.info("Using custom Anthropic API: %s", base_url)
+
+    return base_url, api_key
+
+
+def _chat_response(result: AgentResult, thread_id: str) -> Response:
+    """Serialize an agent result as a chat response.
+
+    The model is built once here and dumped by pydantic-core directly,
+    skipping FastAPI's second validation pass over `response_model`.
+
+    Args:
+        result: Agent result with `text` and `file_ids`.
+        thread_id: Thread ID for context continuity.
+
+    Returns:
+        JSON response.
+    """
+    response = ChatResponse(
+        text=result["text"],
+        files=result["file_ids"],
+        thread_id=thread_id,
+    )
+    return Response(response.model_dump_json(), media_type="application/json")
+
+
 @app.post("/api/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest) -> ChatResponse:
+async def chat(request: ChatRequest) -> Response:
     """Chat with the agent.
 
     Args:
@@ -122,65 +302,89 @@ async def chat(request: ChatRequest) -> ChatResponse:
     Raises:
         HTTPException: If agent execution fails.
     """
+    registry, router = state.registry, state.router
     if not registry or not router:
         raise HTTPException(status_code=500, detail="Agent not initialized")
 
     # Generate thread_id if not provided
-    thread_id = request.thread_id or uuid4().hex
+    thread_id = request.thread_id or secrets.token_hex(16)
 
     logger.info("Chat request on thread %s: %s", thread_id, request.message[:50])
 
     try:
-        # Get all tools
-        all_tools = registry.get_all_tools()
-
-        # Route to relevant tools
-        selected_tools = router.route_tools(
-            request.message,
-            all_tools,
-            get_manifest=registry.get_manifest,
-        )
-
-        logger.info("Selected %d tools for this request", len(selected_tools))
-
-        # Get settings for API configuration
-        settings = get_settings()
-
-        # Determine which API to use
-        base_url = None
-        api_key = None
-
-        if settings.use_openai_compatible and settings.openai_base_url:
-            # Use OpenAI-compatible endpoint
-            base_url = settings.openai_base_url
-            api_key = settings.openai_api_key
-            logger.info("Using OpenAI-compatible API: %s", base_url)
-        elif settings.anthropic_base_url:
-            # Use custom Anthropic endpoint
-            base_url = settings.anthropic_base_url
-            api_key = settings.anthropic_api_key
-            logger.info("Using custom Anthropic API: %s", base_url)
-
-        # Create agent with selected tools and custom API config
-        agent = create_agent(selected_tools, base_url=base_url, api_key=api_key)
+        # Stateless requests only depend on the message, so they can be served from cache
+        if request.thread_id is None:
+            cached = response_cache.get(request.message)
+            if cached is not None:
+                logger.info("Serving cached response")
+                # Record the exchange so the returned thread_id can be resumed
+                base_url, api_key = _get_model_config()
+                agent = create_agent([], base_url=base_url, api_key=api_key)
+                await aseed_thread(agent, request.message, cached["text"], thread_id=thread_id)
+                return _chat_response(cached, thread_id)
+
+        agent = _create_chat_agent(request.message, registry, router)
 
         # Invoke agent
-        result = invoke_agent(agent, request.message, thread_id=thread_id)
+        result = await ainvoke_agent(agent, request.message, thread_id=thread_id)
+
+        # Tool runs have side effects (e.g. newly generated files), so only
+        # plain answers are reused
+        if request.thread_id is None and not result["used_tools"] and not result["file_ids"]:
+            response_cache.put(request.message, result)
 
-        # Return response
-        return ChatResponse(
-            text=result["text"],
-            files=result.get("file_ids", []),
-            thread_id=thread_id,
-        )
+        return _chat_response(result, thread_id)
 
     except Exception as e:
         logger.error("Agent execution failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Agent execution failed: {e}") from e
 
 
-@app.get("/api/file/{file_id}", response_class=StreamingResponse)
-async def download_file(file_id: str) -> StreamingResponse:
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """Chat with the agent, streaming the response as Server-Sent Events.
+
+    Emits `token` events with text deltas as the model generates them,
+    followed by a single `done` event with the file IDs and thread_id
+    (or an `error` event if execution fails).
+
+    Args:
+        request: Chat request with message and optional thread_id.
+
+    Returns:
+        Event stream response.
+
+    Raises:
+        HTTPException: If the agent is not initialized.
+    """
+    registry, router = state.registry, state.router
+    if not registry or not router:
+        raise HTTPException(status_code=500, detail="Agent not initialized")
+
+    # Generate thread_id if not provided
+    thread_id = request.thread_id or secrets.token_hex(16)
+
+    logger.info("Streaming chat request on thread %s: %s", thread_id, request.message[:50])
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        try:
+            agent = _create_chat_agent(request.message, registry, router)
+
+            async for event in astream_agent(agent, request.message, thread_id=thread_id):
+                if event["type"] == "done":
+                    event = {"type": "done", "files": event["file_ids"], "thread_id": thread_id}
+                yield b"data: " + orjson.dumps(event) + b"\n\n"
+
+        except Exception as e:
+            logger.error("Agent execution failed: %s", e, exc_info=True)
+            error = {"type": "error", "detail": f"Agent execution failed: {e}"}
+            yield b"data: " + orjson.dumps(error) + b"\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@app.get("/api/file/{file_id}", response_class=FileResponse)
+async def download_file(file_id: str) -> FileResponse:
     """Download a file by ID.
 
     Args:
@@ -192,17 +396,18 @@ async def download_file(file_id: str) -> StreamingResponse:
     Raises:
         HTTPException: If file not found.
     """
+    file_store = state.file_store
     if not file_store:
         raise HTTPException(status_code=500, detail="File store not initialized")
 
-    # Get file content
-    content = file_store.retrieve(file_id)
+    # Resolve the file without blocking the event loop on disk access
+    file_path = await asyncio.to_thread(file_store.path_for, file_id)
 
-    if content is None:
+    if file_path is None:
         raise HTTPException(status_code=404, detail="File not found")
 
     # Get metadata
-    metadata = file_store.get_metadata(file_id)
+    metadata = await asyncio.to_thread(file_store.get_metadata, file_id)
 
     filename = metadata.get("filename", file_id) if metadata else file_id
     content_type = (
@@ -213,14 +418,8 @@ async def download_file(file_id: str) -> StreamingResponse:
 
     logger.info("Serving file: %s", filename)
 
-    # Return file as streaming response
-    from io import BytesIO
-
-    return StreamingResponse(
-        BytesIO(content),
-        media_type=content_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    # Stream straight from disk (sendfile where available)
+    return FileResponse(file_path, media_type=content_type, filename=filename)
 
 
 @app.get("/api/file/{file_id}/metadata", response_model=FileMetadata)
@@ -236,6 +435,7 @@ async def get_file_metadata(file_id: str) -> FileMetadata:
     Raises:
         HTTPException: If file not found.
     """
+    file_store = state.file_store
     if not file_store:
         raise HTTPException(status_code=500, detail="File store not initialized")
 
@@ -248,44 +448,43 @@ async def get_file_metadata(file_id: str) -> FileMetadata:
 
 
 @app.get("/api/skills")
-async def list_skills() -> list[dict[str, str]]:
+async def list_skills() -> Response:
     """List all loaded skills.
 
     Returns:
         List of skill metadata.
     """
-    if not registry:
+    payload = state.skills_payload
+    if payload is None:
         raise HTTPException(status_code=500, detail="Registry not initialized")
 
-    manifests = registry.get_all_manifests()
-
-    return [
-        {
-            "name": m.name,
-            "description": m.description,
-            "runtime": m.runtime.type,
-            "tags": ", ".join(m.tags),
-        }
-        for m in manifests
-    ]
+    return Response(payload, media_type="application/json")
 
 
 @app.post("/api/reload")
-async def reload_skills() -> dict[str, str]:
+async def reload_skills() -> dict[str, str | int]:
     """Reload skills from disk.
 
     Returns:
         Status message.
     """
+    registry = state.registry
     if not registry:
         raise HTTPException(status_code=500, detail="Registry not initialized")
 
-    registry.reload()
+    new_registry = await asyncio.to_thread(registry.reloaded)
 
-    # Update router with new manifests
-    global router
-    manifests = registry.get_all_manifests()
+    # Build the new router on the side, then swap everything in together
+    manifests = new_registry.get_all_manifests()
     router = IntentRouter(manifests, max_tools=5)
+    skills_payload = _serialize_skills(new_registry)
+
+    state.registry = new_registry
+    state.router = router
+    state.skills_payload = skills_payload
+
+    # Cached answers may have used skills that changed
+    response_cache.clear()
 
     logger.info("Skills reloaded: %d manifests", len(manifests))
 
@@ -298,4 +497,18 @@ if __name__ == "__main__":
     port = int(os.getenv("API_PORT", "8000"))
     host = os.getenv("API_HOST", "0.0.0.0")
 
-    uvicorn.run(app, host=host, port=port)
+    # Thread history lives in each worker's in-memory checkpointer, so a
+    # follow-up turn that lands on another worker loses its context. Only run
+    # more than one worker for stateless traffic or with a shared checkpointer.
+    workers = int(os.getenv("API_WORKERS", "1"))
+
+    # uvloop + httptools come with uvicorn[standard]; the import string is
+    # required for uvicorn to spawn multiple workers.
+    uvicorn.run(
+        "skillslike.api.main:app",
+        host=host,
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+    )
@@ -1,11 +1,13 @@
 """Pydantic schemas for API requests and responses."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ChatRequest(BaseModel):
     """Request schema for chat endpoint."""
 
+    model_config = ConfigDict(extra="forbid")
+
     message: str = Field(description="User message")
     thread_id: str | None = Field(default=None, description="Optional thread ID for context")
 
@@ -13,6 +15,8 @@ class ChatRequest(BaseModel):
 class ChatResponse(BaseModel):
     """Response schema for chat endpoint."""
 
+    model_config = ConfigDict(extra="forbid")
+
     text: str = Field(description="Agent response text")
     files: list[str] = Field(default_factory=list, description="List of file IDs")
     thread_id: str = Field(description="Thread ID for context continuity")
@@ -21,6 +25,8 @@ class ChatResponse(BaseModel):
 class FileMetadata(BaseModel):
     """File metadata schema."""
 
+    model_config = ConfigDict(extra="forbid")
+
     file_id: str
     filename: str
     content_type: str
@@ -29,5 +35,7 @@ class FileMetadata(BaseModel):
 class HealthResponse(BaseModel):
     """Health check response."""
 
+    model_config = ConfigDict(extra="forbid")
+
     status: str = "healthy"
     skills_loaded: int = 0
@@ -35,6 +35,7 @@ class Settings(BaseSettings):
     skills_dir: Path = Path("skills/")
     file_store_dir: Path = Path("data/files/")
     checkpoint_store: str = "memory"  # memory, redis, sqlite
+    checkpoint_max_threads: int = 1024  # in-memory threads kept before evicting the oldest
 
     # Executor
     docker_enabled: bool = False
@@ -43,6 +44,7 @@ class Settings(BaseSettings):
     # API
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    response_cache_size: int = 256  # stateless chat responses; 0 disables
 
     # Routing
     max_tools_per_request: int = 5
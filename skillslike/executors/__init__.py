@@ -1,8 +1,35 @@
-"""Tool executors for different runtime types."""
+"""Tool executors for different runtime types.
 
-from skillslike.executors.anthropic_executor import AnthropicExecutor
-from skillslike.executors.base import BaseExecutor
-from skillslike.executors.custom_executor import CustomExecutor
-from skillslike.executors.image_gen_executor import ImageGenExecutor
+Executor classes are imported on first access, so selecting one executor
+does not pull in the dependencies of the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from skillslike.executors.anthropic_executor import AnthropicExecutor
+    from skillslike.executors.base import BaseExecutor
+    from skillslike.executors.custom_executor import CustomExecutor
+    from skillslike.executors.image_gen_executor import ImageGenExecutor
+
+_EXPORTS = {
+    "BaseExecutor": "skillslike.executors.base",
+    "AnthropicExecutor": "skillslike.executors.anthropic_executor",
+    "CustomExecutor": "skillslike.executors.custom_executor",
+    "ImageGenExecutor": "skillslike.executors.image_gen_executor",
+}
 
 __all__ = ["BaseExecutor", "AnthropicExecutor", "CustomExecutor", "ImageGenExecutor"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import executor classes lazily on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
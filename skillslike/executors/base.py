@@ -1,5 +1,6 @@
 """Base executor interface for skill execution."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -32,3 +33,17 @@ class BaseExecutor(ABC):
             RuntimeError: If execution fails.
         """
         pass
+
+    async def aexecute(self, **kwargs: Any) -> str:
+        """Execute the skill asynchronously.
+
+        The default runs `execute` in a worker thread; executors with native
+        async I/O should override this.
+
+        Args:
+            **kwargs: Skill-specific arguments.
+
+        Returns:
+            Execution result as a string.
+        """
+        return await asyncio.to_thread(self.execute, **kwargs)
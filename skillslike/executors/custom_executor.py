@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 
 from skillslike.executors.base import BaseExecutor
+from skillslike.executors.http import get_async_client, get_client
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +53,41 @@ class CustomExecutor(BaseExecutor):
             logger.error(msg)
             raise TimeoutError(msg) from e
 
+    async def aexecute(self, **kwargs: Any) -> str:
+        """Execute a custom skill asynchronously.
+
+        Args:
+            **kwargs: Skill arguments.
+
+        Returns:
+            Execution result with text and optional file_id.
+
+        Raises:
+            TimeoutError: If execution exceeds timeout.
+            RuntimeError: If execution fails.
+        """
+        runtime_type = self.manifest.runtime.type
+
+        logger.info(
+            "Executing custom skill '%s' (runtime: %s)",
+            self.manifest.name,
+            runtime_type,
+        )
+
+        try:
+            if runtime_type == "service":
+                return await self._aexecute_service(kwargs)
+            elif runtime_type == "docker":
+                return self._execute_docker(kwargs)
+            else:
+                msg = f"Unsupported runtime type: {runtime_type}"
+                raise RuntimeError(msg)
+
+        except TimeoutError as e:
+            msg = f"Skill '{self.manifest.name}' timed out after {self.manifest.runtime.timeout}s"
+            logger.error(msg)
+            raise TimeoutError(msg) from e
+
     def _execute_service(self, kwargs: dict[str, Any]) -> str:
         """Execute skill via HTTP service endpoint.
 
@@ -61,40 +97,88 @@ class CustomExecutor(BaseExecutor):
         Returns:
             Service response text.
         """
-        endpoint = self.manifest.runtime.endpoint
-
-        if not endpoint:
-            msg = f"Service runtime for '{self.manifest.name}' missing endpoint"
-            raise RuntimeError(msg)
-
-        logger.debug("Calling service endpoint: %s", endpoint)
+        endpoint = self._get_endpoint()
 
         # Call the service endpoint
         try:
-            response = httpx.post(
+            response = get_client().post(
                 endpoint,
                 json=kwargs,
                 timeout=self.manifest.runtime.timeout,
             )
             response.raise_for_status()
 
-            result = response.json()
+            return self._format_service_result(response.json())
 
-            # Extract text and file_id if present
-            text = result.get("text", str(result))
-            file_id = result.get("file_id")
+        except httpx.HTTPError as e:
+            msg = f"Service call failed: {e}"
+            logger.error(msg)
+            raise RuntimeError(msg) from e
+
+    async def _aexecute_service(self, kwargs: dict[str, Any]) -> str:
+        """Execute skill via HTTP service endpoint asynchronously.
+
+        Args:
+            kwargs: Skill arguments.
+
+        Returns:
+            Service response text.
+        """
+        endpoint = self._get_endpoint()
 
-            if file_id:
-                text += f"\nfile_id: {file_id}"
+        # Call the service endpoint
+        try:
+            response = await get_async_client().post(
+                endpoint,
+                json=kwargs,
+                timeout=self.manifest.runtime.timeout,
+            )
+            response.raise_for_status()
 
-            logger.info("Service call completed successfully")
-            return text
+            return self._format_service_result(response.json())
 
         except httpx.HTTPError as e:
             msg = f"Service call failed: {e}"
             logger.error(msg)
             raise RuntimeError(msg) from e
 
+    def _get_endpoint(self) -> str:
+        """Get the service endpoint for this skill.
+
+        Returns:
+            Service endpoint URL.
+
+        Raises:
+            RuntimeError: If the manifest has no endpoint.
+        """
+        endpoint = self.manifest.runtime.endpoint
+
+        if not endpoint:
+            msg = f"Service runtime for '{self.manifest.name}' missing endpoint"
+            raise RuntimeError(msg)
+
+        logger.debug("Calling service endpoint: %s", endpoint)
+        return endpoint
+
+    def _format_service_result(self, result: dict[str, Any]) -> str:
+        """Format a service response as tool output.
+
+        Args:
+            result: Parsed JSON response from the service.
+
+        Returns:
+            Response text, with the file_id appended if present.
+        """
+        # Extract text and file_id if present
+        text: str = result.get("text", str(result))
+        file_id: str | None = result.get("file_id")
+
+        if file_id:
+            text += f"\nfile_id: {file_id}"
+
+        logger.info("Service call completed successfully")
+        return text
+
     def _execute_docker(self, kwargs: dict[str, Any]) -> str:
         """Execute skill via Docker container.
 
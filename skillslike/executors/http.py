@@ -0,0 +1,229 @@
+"""Shared HTTP clients for executors.
+
+Executors reuse pooled clients instead of opening a new connection (and TLS
+session) for every skill invocation.
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+# Transport-level retries only cover failed connection attempts
+_CONNECT_RETRIES = 3
+
+# Application-level retries for transient HTTP failures
+MAX_ATTEMPTS = 3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (
+    httpx.TimeoutException,
+    httpx.RemoteProtocolError,
+)
+_MAX_RETRY_DELAY = 10.0
+
+T = TypeVar("T")
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+# Async clients are bound to the event loop that created them
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_client() -> httpx.Client:
+    """Get the shared sync HTTP client, creating it on first use.
+
+    Sync tools run in worker threads, so creation is guarded by a lock.
+
+    Returns:
+        Pooled `httpx.Client`.
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        with _client_lock:
+            if _client is None or _client.is_closed:
+                _client = httpx.Client(
+                    transport=httpx.HTTPTransport(
+                        http2=True, limits=_LIMITS, retries=_CONNECT_RETRIES
+                    )
+                )
+                logger.debug("Created shared HTTP client")
+
+    return _client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client for the running event loop.
+
+    A client's connections belong to the loop they were opened on, so each
+    loop (the API server's, or one started with `asyncio.run`) gets its own
+    client, created on first use and dropped with the loop.
+
+    Returns:
+        Pooled `httpx.AsyncClient`.
+
+    Raises:
+        RuntimeError: If called without a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=_LIMITS, retries=_CONNECT_RETRIES)
+        )
+        _async_clients[loop] = client
+        logger.debug("Created shared async HTTP client")
+
+    return client
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """Get the delay before retrying a failed attempt.
+
+    Args:
+        attempt: Number of the attempt that failed (1-based).
+        error: The error raised by the attempt.
+
+    Returns:
+        Delay in seconds, honoring `Retry-After` when present.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        retry_after = error.response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), _MAX_RETRY_DELAY)
+            except ValueError:
+                pass  # HTTP-date form; use exponential backoff
+
+    return min(0.5 * 2.0 ** (attempt - 1), _MAX_RETRY_DELAY)
+
+
+def _should_retry(
+    error: Exception,
+    attempt: int,
+    retry_statuses: frozenset[int],
+    retry_exceptions: tuple[type[Exception], ...],
+) -> bool:
+    """Check whether a failed attempt should be retried.
+
+    Args:
+        error: The error raised by the attempt.
+        attempt: Number of the attempt that failed (1-based).
+        retry_statuses: Response status codes that are retried.
+        retry_exceptions: Exception types that are retried.
+
+    Returns:
+        `True` if another attempt should be made.
+    """
+    if attempt >= MAX_ATTEMPTS:
+        return False
+
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in retry_statuses
+
+    return isinstance(error, retry_exceptions)
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    *,
+    retry_statuses: frozenset[int] = RETRY_STATUSES,
+    retry_exceptions: tuple[type[Exception], ...] = RETRY_EXCEPTIONS,
+) -> T:
+    """Call a request function, retrying transient failures with backoff.
+
+    `func` should perform the request and call `raise_for_status()`; it is
+    called at most `MAX_ATTEMPTS` times.
+
+    Args:
+        func: Function performing the request.
+        retry_statuses: Response status codes that are retried.
+        retry_exceptions: Exception types that are retried.
+
+    Returns:
+        The result of `func`.
+
+    Raises:
+        httpx.HTTPError: If the last attempt fails or the error is not retryable.
+    """
+    attempt = 1
+    while True:
+        try:
+            return func()
+        except httpx.HTTPError as e:
+            if not _should_retry(e, attempt, retry_statuses, retry_exceptions):
+                raise
+            delay = _retry_delay(attempt, e)
+
+        logger.warning("HTTP request failed (attempt %d), retrying in %.1fs", attempt, delay)
+        time.sleep(delay)
+        attempt += 1
+
+
+async def acall_with_retry(
+    func: Callable[[], Awaitable[T]],
+    *,
+    retry_statuses: frozenset[int] = RETRY_STATUSES,
+    retry_exceptions: tuple[type[Exception], ...] = RETRY_EXCEPTIONS,
+) -> T:
+    """Async variant of `call_with_retry`.
+
+    Args:
+        func: Coroutine function performing the request.
+        retry_statuses: Response status codes that are retried.
+        retry_exceptions: Exception types that are retried.
+
+    Returns:
+        The result of `func`.
+
+    Raises:
+        httpx.HTTPError: If the last attempt fails or the error is not retryable.
+    """
+    attempt = 1
+    while True:
+        try:
+            return await func()
+        except httpx.HTTPError as e:
+            if not _should_retry(e, attempt, retry_statuses, retry_exceptions):
+                raise
+            delay = _retry_delay(attempt, e)
+
+        logger.warning("HTTP request failed (attempt %d), retrying in %.1fs", attempt, delay)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def close_client() -> None:
+    """Close the shared sync HTTP client."""
+    global _client
+
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+            logger.debug("Closed shared HTTP client")
+
+
+async def aclose_clients() -> None:
+    """Close the shared sync client and the running loop's async client."""
+    close_client()
+
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+        logger.debug("Closed shared async HTTP client")
+
+
+atexit.register(close_client)
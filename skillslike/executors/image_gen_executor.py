@@ -1,16 +1,46 @@
 """Executor for image generation using nano-banana-2 API."""
 
-import base64
+import asyncio
 import json
 import logging
+import os
+import threading
+import weakref
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
 
 import httpx
 from pydantic import BaseModel, Field
 
+try:
+    # SIMD-accelerated decoder, available with the `fast` extra
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+from skillslike.config import get_settings
 from skillslike.executors.base import BaseExecutor
+from skillslike.executors.http import (
+    acall_with_retry,
+    call_with_retry,
+    get_async_client,
+    get_client,
+)
+from skillslike.models.manifest import SkillManifest
+from skillslike.storage import FileStore
 
 logger = logging.getLogger(__name__)
 
+# Bounds in-flight generation requests across all executors on an event loop
+_GENERATION_CONCURRENCY = int(os.getenv("IMAGE_GEN_CONCURRENCY", "5"))
+_generation_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+_RATE_LIMITED = frozenset({429})
+
 
 class ImageGenInput(BaseModel):
     """Input schema for image generation."""
@@ -26,12 +56,93 @@ class ImageGenInput(BaseModel):
     )
 
 
+def _get_generation_semaphore() -> asyncio.Semaphore:
+    """Get the generation semaphore for the running event loop.
+
+    A semaphore can only be waited on from one loop, so each loop gets its
+    own, created on first use.
+
+    Returns:
+        Semaphore bounding concurrent generations on this loop.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _generation_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _generation_semaphores[loop] = asyncio.Semaphore(_GENERATION_CONCURRENCY)
+    return semaphore
+
+
+def _iter_from_loop(
+    chunks: AsyncIterator[bytes], loop: asyncio.AbstractEventLoop
+) -> Iterator[bytes]:
+    """Iterate an async chunk stream from a worker thread.
+
+    Each chunk is awaited on `loop` while the calling thread waits, so a
+    blocking consumer such as `FileStore.store_stream` can write the chunks
+    off the event loop as they arrive.
+
+    Args:
+        chunks: Async iterator of byte chunks, driven by `loop`.
+        loop: Event loop the iterator belongs to.
+
+    Yields:
+        Byte chunks in order.
+    """
+
+    async def next_chunk() -> bytes:
+        return await anext(chunks)
+
+    while True:
+        try:
+            yield asyncio.run_coroutine_threadsafe(next_chunk(), loop).result()
+        except StopAsyncIteration:
+            return
+
+
 class ImageGenExecutor(BaseExecutor):
     """Executor for nano-banana-2 image generation.
 
     Calls the DALL-E compatible API to generate images from text prompts.
     """
 
+    def __init__(self, manifest: SkillManifest) -> None:
+        """Initialize the executor.
+
+        API credentials are resolved once here rather than on every call.
+
+        Args:
+            manifest: The skill manifest.
+        """
+        super().__init__(manifest)
+
+        # Get API credentials from Settings
+        settings = get_settings()
+        self._api_key = settings.openai_api_key
+        base_url = (settings.openai_base_url or "https://api.bltcy.ai").removesuffix("/v1")
+
+        self._endpoint = f"{base_url}/v1/images/generations"
+        self._headers = {
+            "Authorization": f"Bearer {self._api_key}",
+            "Content-Type": "application/json",
+        }
+
+        # Opened on first use and reused for every stored image, so each
+        # download doesn't reconnect to the metadata database
+        self._file_store: FileStore | None = None
+        self._file_store_lock = threading.Lock()
+
+    def _get_file_store(self) -> FileStore:
+        """Get the file store for generated images, creating it on first use.
+
+        Returns:
+            FileStore instance shared by all calls on this executor.
+        """
+        if self._file_store is None:
+            with self._file_store_lock:
+                if self._file_store is None:
+                    self._file_store = FileStore()
+        return self._file_store
+
     def get_input_schema(self) -> type[BaseModel]:
         """Get the input schema for this executor.
 
@@ -54,11 +165,117 @@ class ImageGenExecutor(BaseExecutor):
         Raises:
             RuntimeError: If API call fails.
         """
+        payload = self._build_payload(prompt, aspect_ratio, image_size)
+
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Calling image generation API: %s", self._endpoint)
+                logger.debug("Payload: %s", json.dumps(payload))
+
+            def post() -> httpx.Response:
+                response = get_client().post(
+                    self._endpoint,
+                    headers=self._headers,
+                    json=payload,
+                    timeout=self.manifest.runtime.timeout,
+                )
+                response.raise_for_status()
+                return response
+
+            # Generation is not idempotent, so only rate-limited calls are retried
+            response = call_with_retry(post, retry_statuses=_RATE_LIMITED, retry_exceptions=())
+
+            kind, value = self._parse_response(response.json(), payload["response_format"])
+
+            if kind == "url":
+                # Download and store the image
+                file_id = self._download_and_store_image(value)
+            else:
+                file_id = self._store_base64_image(value)
+
+            return self._format_result(payload, file_id, value if kind == "url" else None)
+
+        except httpx.HTTPError as e:
+            raise self._api_error(e) from e
+
+    async def aexecute(
+        self, prompt: str, aspect_ratio: str = "1:1", image_size: str = "4K"
+    ) -> str:
+        """Execute image generation asynchronously.
+
+        Concurrent generations across all executors on the running event
+        loop are bounded by `IMAGE_GEN_CONCURRENCY` (default 5).
+
+        Args:
+            prompt: Description of the image to generate.
+            aspect_ratio: Image aspect ratio (default "1:1").
+            image_size: Image resolution 1K/2K/4K (default "4K").
+
+        Returns:
+            Execution result with image URL and file_id.
+
+        Raises:
+            RuntimeError: If API call fails.
+        """
+        payload = self._build_payload(prompt, aspect_ratio, image_size)
+
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Calling image generation API: %s", self._endpoint)
+                logger.debug("Payload: %s", json.dumps(payload))
+
+            async def post() -> httpx.Response:
+                response = await get_async_client().post(
+                    self._endpoint,
+                    headers=self._headers,
+                    json=payload,
+                    timeout=self.manifest.runtime.timeout,
+                )
+                response.raise_for_status()
+                return response
+
+            # Generation is not idempotent, so only rate-limited calls are
+            # retried; backing off while holding the semaphore throttles
+            # other generations too
+            async with _get_generation_semaphore():
+                response = await acall_with_retry(
+                    post, retry_statuses=_RATE_LIMITED, retry_exceptions=()
+                )
+
+            kind, value = self._parse_response(response.json(), payload["response_format"])
+
+            if kind == "url":
+                # Download and store the image
+                file_id = await self._adownload_and_store_image(value)
+            else:
+                file_id = await asyncio.to_thread(self._store_base64_image, value)
+
+            return self._format_result(payload, file_id, value if kind == "url" else None)
+
+        except httpx.HTTPError as e:
+            raise self._api_error(e) from e
+
+    def _build_payload(self, prompt: str, aspect_ratio: str, image_size: str) -> dict[str, str]:
+        """Build the image generation request payload.
+
+        Args:
+            prompt: Description of the image to generate.
+            aspect_ratio: Image aspect ratio.
+            image_size: Image resolution.
+
+        Returns:
+            Request payload.
+
+        Raises:
+            RuntimeError: If the prompt or API key is missing.
+        """
         if not prompt:
             msg = "Image generation requires a 'prompt' parameter"
             raise RuntimeError(msg)
 
-        response_format = "url"
+        if not self._api_key:
+            msg = "API key not found. Set OPENAI_API_KEY in .env file."
+            raise RuntimeError(msg)
 
         logger.info(
             "Generating image with nano-banana-2: prompt='%s', ratio=%s, size=%s",
@@ -67,86 +284,84 @@ class ImageGenExecutor(BaseExecutor):
             image_size,
         )
 
-        # Get API credentials from Settings
-        from skillslike.config import get_settings
-
-        settings = get_settings()
-        api_key = settings.openai_api_key
-        base_url = settings.openai_base_url or "https://api.bltcy.ai"
-
-        if not api_key:
-            msg = "API key not found. Set OPENAI_API_KEY in .env file."
-            raise RuntimeError(msg)
-
-        # Ensure base_url doesn't end with /v1
-        if base_url.endswith("/v1"):
-            base_url = base_url[:-3]
-
-        # Prepare request
-        endpoint = f"{base_url}/v1/images/generations"
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {
+        return {
             "model": "nano-banana-2",
             "prompt": prompt,
             "aspect_ratio": aspect_ratio,
             "image_size": image_size,
-            "response_format": response_format,
+            "response_format": "url",
         }
 
-        try:
-            logger.debug("Calling image generation API: %s", endpoint)
-            logger.debug("Payload: %s", json.dumps(payload))
-
-            response = httpx.post(
-                endpoint,
-                headers=headers,
-                json=payload,
-                timeout=self.manifest.runtime.timeout,
-            )
-            response.raise_for_status()
+    def _parse_response(self, result: dict[str, Any], response_format: str) -> tuple[str, str]:
+        """Extract the generated image from an API response.
+
+        Args:
+            result: Parsed JSON response.
+            response_format: Requested response format (`url` or `b64_json`).
 
-            result = response.json()
+        Returns:
+            Tuple of `(kind, value)` where kind is `url` or `b64_json`.
+
+        Raises:
+            RuntimeError: If the response contains no usable image.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Image generation response: %s", json.dumps(result)[:200])
 
-            # Parse response
-            if "data" in result and len(result["data"]) > 0:
-                image_data = result["data"][0]
+        # Parse response
+        if "data" in result and len(result["data"]) > 0:
+            image_data = result["data"][0]
 
-                if response_format == "url" and "url" in image_data:
-                    # URL format
-                    image_url = image_data["url"]
-                    logger.info("Generated image URL: %s", image_url)
+            if response_format == "url" and "url" in image_data:
+                # URL format
+                logger.info("Generated image URL: %s", image_data["url"])
+                return "url", image_data["url"]
 
-                    # Download and store the image
-                    file_id = self._download_and_store_image(image_url)
+            elif response_format == "b64_json" and "b64_json" in image_data:
+                # Base64 format
+                return "b64_json", image_data["b64_json"]
 
-                    return f"图片生成成功！\n\n描述: {prompt}\n比例: {aspect_ratio}\n分辨率: {image_size}\n\nfile_id: {file_id}\n图片URL: {image_url}"
+            else:
+                msg = f"Unexpected response format: {result}"
+                raise RuntimeError(msg)
 
-                elif response_format == "b64_json" and "b64_json" in image_data:
-                    # Base64 format
-                    b64_data = image_data["b64_json"]
-                    file_id = self._store_base64_image(b64_data)
+        else:
+            msg = f"No image data in response: {result}"
+            raise RuntimeError(msg)
 
-                    return f"图片生成成功！\n\n描述: {prompt}\n比例: {aspect_ratio}\n分辨率: {image_size}\n\nfile_id: {file_id}"
+    def _format_result(self, payload: dict[str, str], file_id: str, image_url: str | None) -> str:
+        """Format the tool output for a generated image.
 
-                else:
-                    msg = f"Unexpected response format: {result}"
-                    raise RuntimeError(msg)
+        Args:
+            payload: Request payload.
+            file_id: File ID of the stored image.
+            image_url: Source URL of the image, if any.
 
-            else:
-                msg = f"No image data in response: {result}"
-                raise RuntimeError(msg)
+        Returns:
+            Tool output text including the file_id.
+        """
+        text = (
+            f"图片生成成功！\n\n描述: {payload['prompt']}\n比例: {payload['aspect_ratio']}\n"
+            f"分辨率: {payload['image_size']}\n\nfile_id: {file_id}"
+        )
+        if image_url:
+            text += f"\n图片URL: {image_url}"
+        return text
 
-        except httpx.HTTPError as e:
-            msg = f"Image generation API call failed: {e}"
-            logger.error(msg)
-            if hasattr(e, "response") and e.response is not None:
-                logger.error("Response body: %s", e.response.text)
-            raise RuntimeError(msg) from e
+    def _api_error(self, e: httpx.HTTPError) -> RuntimeError:
+        """Log a failed API call and wrap it.
+
+        Args:
+            e: The HTTP error.
+
+        Returns:
+            RuntimeError to raise.
+        """
+        msg = f"Image generation API call failed: {e}"
+        logger.error(msg)
+        if hasattr(e, "response") and e.response is not None:
+            logger.error("Response body: %s", e.response.text)
+        return RuntimeError(msg)
 
     def _download_and_store_image(self, image_url: str) -> str:
         """Download image from URL and store it.
@@ -160,18 +375,56 @@ class ImageGenExecutor(BaseExecutor):
         try:
             # Download image
             logger.debug("Downloading image from: %s", image_url)
-            response = httpx.get(image_url, timeout=30)
-            response.raise_for_status()
+            file_store = self._get_file_store()
 
-            # Store in file store
-            from skillslike.storage import FileStore
+            def download() -> str:
+                # Stream straight to disk instead of buffering the whole image
+                with get_client().stream("GET", image_url, timeout=30) as response:
+                    response.raise_for_status()
+                    return file_store.store_stream(
+                        response.iter_bytes(_DOWNLOAD_CHUNK_SIZE),
+                        filename="generated_image.png",
+                        content_type="image/png",
+                    )
 
-            file_store = FileStore()
-            file_id = file_store.store(
-                response.content,
-                filename="generated_image.png",
-                content_type="image/png",
-            )
+            file_id = call_with_retry(download)
+
+            logger.info("Stored image with file_id: %s", file_id)
+            return file_id
+
+        except Exception as e:
+            logger.error("Failed to download/store image: %s", e)
+            # Return a placeholder if download fails
+            return "download-failed"
+
+    async def _adownload_and_store_image(self, image_url: str) -> str:
+        """Download image from URL and store it asynchronously.
+
+        Args:
+            image_url: URL of the generated image.
+
+        Returns:
+            File ID of the stored image.
+        """
+        try:
+            # Download image
+            logger.debug("Downloading image from: %s", image_url)
+            file_store = self._get_file_store()
+
+            async def download() -> str:
+                async with get_async_client().stream("GET", image_url, timeout=30) as response:
+                    response.raise_for_status()
+                    # store_stream writes from a worker thread, pulling each
+                    # chunk from the response on this loop
+                    chunks = response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE)
+                    return await asyncio.to_thread(
+                        file_store.store_stream,
+                        _iter_from_loop(chunks, asyncio.get_running_loop()),
+                        filename="generated_image.png",
+                        content_type="image/png",
+                    )
+
+            file_id = await acall_with_retry(download)
 
             logger.info("Stored image with file_id: %s", file_id)
             return file_id
@@ -192,12 +445,10 @@ class ImageGenExecutor(BaseExecutor):
         """
         try:
             # Decode base64
-            image_bytes = base64.b64decode(b64_data)
+            image_bytes = b64decode(b64_data)
 
             # Store in file store
-            from skillslike.storage import FileStore
-
-            file_store = FileStore()
+            file_store = self._get_file_store()
             file_id = file_store.store(
                 image_bytes,
                 filename="generated_image.png",
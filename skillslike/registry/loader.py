@@ -1,6 +1,8 @@
 """Manifest loader for reading skill definitions from YAML files."""
 
 import logging
+import os
+from collections import Counter
 from pathlib import Path
 
 import yaml
@@ -8,8 +10,63 @@ from pydantic import ValidationError
 
 from skillslike.models.manifest import SkillManifest
 
+try:
+    # libyaml-backed loader, much faster than the pure-Python one
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_MANIFEST_SUFFIXES = (".yaml", ".yml")
+
+
+def _file_signature(file_path: Path) -> tuple[int, int]:
+    """Get the change-detection signature of a file.
+
+    Size is included so rewrites within the filesystem's mtime granularity
+    are still noticed when the length changed.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        Tuple of `(st_mtime_ns, st_size)`.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    stat = file_path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _parse_manifest(file_path: Path) -> SkillManifest:
+    """Parse and validate a manifest file.
+
+    Args:
+        file_path: Path to the manifest YAML file.
+
+    Returns:
+        Validated skill manifest.
+
+    Raises:
+        ValidationError: If manifest fails validation.
+        ValueError: If file cannot be parsed.
+    """
+    try:
+        # Hand libyaml the raw bytes in one read instead of a decoded stream
+        data = yaml.load(file_path.read_bytes(), Loader=_SafeLoader)
+
+        if not data:
+            msg = f"Empty manifest file: {file_path}"
+            raise ValueError(msg)
+
+        return SkillManifest.model_validate(data)
+
+    except yaml.YAMLError as e:
+        msg = f"Invalid YAML in {file_path}: {e}"
+        raise ValueError(msg) from e
+
 
 class ManifestLoader:
     """Loads skill manifests from YAML files."""
@@ -25,6 +82,10 @@ class ManifestLoader:
             msg = f"Skills directory does not exist: {self.skills_dir}"
             raise ValueError(msg)
 
+        # Parsed manifests keyed by path, reused while the file's
+        # (mtime, size) signature is unchanged
+        self._cache: dict[Path, tuple[tuple[int, int], SkillManifest]] = {}
+
     def load_all(self) -> list[SkillManifest]:
         """Load all skill manifests from the skills directory.
 
@@ -36,8 +97,16 @@ class ManifestLoader:
         """
         manifests: list[SkillManifest] = []
 
-        # Find all YAML files recursively
-        yaml_files = list(self.skills_dir.rglob("*.yaml")) + list(self.skills_dir.rglob("*.yml"))
+        # Find all YAML files recursively in a single directory walk
+        yaml_files = sorted(
+            Path(root) / name
+            for root, _, files in os.walk(self.skills_dir)
+            for name in files
+            if name.endswith(_MANIFEST_SUFFIXES)
+        )
+
+        # Forget manifests whose files are gone
+        self._cache = {path: self._cache[path] for path in yaml_files if path in self._cache}
 
         if not yaml_files:
             logger.warning("No manifest files found in %s", self.skills_dir)
@@ -61,7 +130,8 @@ class ManifestLoader:
             file_path: Path to the manifest YAML file.
 
         Returns:
-            Validated skill manifest.
+            Validated skill manifest. Unchanged files (same mtime and size) return the
+            previously parsed manifest.
 
         Raises:
             ValidationError: If manifest fails validation.
@@ -69,23 +139,19 @@ class ManifestLoader:
         """
         file_path = Path(file_path)
 
-        if not file_path.exists():
-            msg = f"Manifest file does not exist: {file_path}"
-            raise ValueError(msg)
-
         try:
-            with file_path.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            if not data:
-                msg = f"Empty manifest file: {file_path}"
-                raise ValueError(msg)
+            signature = _file_signature(file_path)
+        except FileNotFoundError:
+            msg = f"Manifest file does not exist: {file_path}"
+            raise ValueError(msg) from None
 
-            return SkillManifest.model_validate(data)
+        cached = self._cache.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
 
-        except yaml.YAMLError as e:
-            msg = f"Invalid YAML in {file_path}: {e}"
-            raise ValueError(msg) from e
+        manifest = _parse_manifest(file_path)
+        self._cache[file_path] = (signature, manifest)
+        return manifest
 
     def validate_manifests(self, manifests: list[SkillManifest]) -> dict[str, list[str]]:
         """Validate a list of manifests for conflicts and issues.
@@ -97,12 +163,11 @@ class ManifestLoader:
             Dictionary mapping skill names to list of validation warnings.
         """
         warnings: dict[str, list[str]] = {}
-        names = [m.name for m in manifests]
+        name_counts = Counter(m.name for m in manifests)
 
         # Check for duplicate names
-        if len(names) != len(set(names)):
-            duplicates = [name for name in names if names.count(name) > 1]
-            for dup in set(duplicates):
+        for dup, count in name_counts.items():
+            if count > 1:
                 warnings.setdefault(dup, []).append(f"Duplicate skill name: {dup}")
 
         # Validate runtime configurations
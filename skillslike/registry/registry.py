@@ -14,13 +14,14 @@ logger = logging.getLogger(__name__)
 class SkillRegistry:
     """Registry for managing skills and their corresponding tools."""
 
-    def __init__(self, skills_dir: str | Path) -> None:
+    def __init__(self, skills_dir: str | Path, *, loader: ManifestLoader | None = None) -> None:
         """Initialize the skill registry.
 
         Args:
             skills_dir: Directory containing skill manifest files.
+            loader: Optional loader to reuse, keeping its parsed manifests.
         """
-        self.loader = ManifestLoader(skills_dir)
+        self.loader = loader or ManifestLoader(skills_dir)
         self.manifests: dict[str, SkillManifest] = {}
         self.tools: dict[str, StructuredTool] = {}
         self._load_manifests()
@@ -71,34 +72,47 @@ class SkillRegistry:
             The actual tool function will be wired to executors.
             This is a placeholder that returns metadata.
         """
-        # Import here to avoid circular dependency
-        from skillslike.executors.anthropic_executor import AnthropicExecutor
-        from skillslike.executors.custom_executor import CustomExecutor
-        from skillslike.executors.image_gen_executor import ImageGenExecutor
+        tool_name = manifest.name.replace("-", "_")
+        # Lets the router map tools back to skills without reversing the name
+        metadata = {"skill_name": manifest.name}
 
-        # Choose executor based on runtime type or skill name
+        # Choose executor based on runtime type or skill name. Executors are
+        # imported here, one per branch, to avoid a circular dependency and so
+        # only the selected executor's dependencies are loaded.
         if manifest.name == "nano-banana-image-gen":
+            from skillslike.executors.image_gen_executor import ImageGenExecutor
+
             executor = ImageGenExecutor(manifest)
             # Use Pydantic schema for image generation
             tool = StructuredTool.from_function(
                 func=executor.execute,
-                name=manifest.name.replace("-", "_"),
+                coroutine=executor.aexecute,
+                name=tool_name,
                 description=manifest.description,
                 args_schema=executor.get_input_schema(),
+                metadata=metadata,
             )
         elif manifest.runtime.type == "anthropic":
+            from skillslike.executors.anthropic_executor import AnthropicExecutor
+
             executor = AnthropicExecutor(manifest)
             tool = StructuredTool.from_function(
                 func=executor.execute,
-                name=manifest.name.replace("-", "_"),
+                coroutine=executor.aexecute,
+                name=tool_name,
                 description=manifest.description,
+                metadata=metadata,
             )
         else:
+            from skillslike.executors.custom_executor import CustomExecutor
+
             executor = CustomExecutor(manifest)
             tool = StructuredTool.from_function(
                 func=executor.execute,
-                name=manifest.name.replace("-", "_"),
+                coroutine=executor.aexecute,
+                name=tool_name,
                 description=manifest.description,
+                metadata=metadata,
             )
 
         return tool
@@ -136,9 +150,27 @@ class SkillRegistry:
                 tools.append(tool)
         return tools
 
-    def reload(self) -> None:
-        """Reload all manifests from disk."""
-        self.manifests.clear()
-        self.tools.clear()
-        self._load_manifests()
-        logger.info("Registry reloaded")
+    def reloaded(self) -> "SkillRegistry":
+        """Load a new registry from disk, leaving this one untouched.
+
+        The caller swaps the result in with a single assignment, so readers
+        never see new manifests next to stale tools. Tools are kept for
+        skills whose manifest file did not change.
+
+        Returns:
+            New skill registry.
+        """
+        registry = SkillRegistry(self.loader.skills_dir, loader=self.loader)
+
+        # Snapshot first: request handlers may add tools to this registry
+        # while the reload runs in a worker thread
+        old_tools = dict(self.tools)
+
+        # The loader returns the same manifest object for unchanged files
+        registry.tools = {
+            name: tool
+            for name, tool in old_tools.items()
+            if registry.manifests.get(name) is self.manifests.get(name)
+        }
+        logger.info("Registry reloaded (%d tools reused)", len(registry.tools))
+        return registry
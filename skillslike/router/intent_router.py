@@ -1,8 +1,14 @@
 """Intent-based router for filtering tools based on user messages."""
 
+import heapq
 import logging
+import math
 import re
+import sys
+from bisect import bisect_left, bisect_right
+from collections import Counter
 from collections.abc import Callable
+from operator import itemgetter
 
 from langchain_core.tools import StructuredTool
 
@@ -10,6 +16,61 @@ from skillslike.models.manifest import SkillManifest
 
 logger = logging.getLogger(__name__)
 
+# Slack when rounding the Jaccard size-pruning bounds to integers
+_BOUND_TOLERANCE = 1e-9
+
+
+# Common Chinese and English stop words
+_STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "这个",
+        "那个",
+        "的",
+        "了",
+        "在",
+        "是",
+        "和",
+    }
+)
+
+# English words of two or more letters (matched against lowercased text) and
+# individual Chinese characters, tokenized in a single scan
+_TOKEN_RE = re.compile(r"[a-z]{2,}|[\u4e00-\u9fff]")
+
+
+def _extract_keywords(text: str) -> frozenset[str]:
+    """Extract keywords from text.
+
+    Args:
+        text: Text to extract keywords from.
+
+    Returns:
+        Set of keywords.
+    """
+    # Split English words and keep individual Chinese characters as keywords
+    # This is a simple approach; for production, use jieba or similar.
+    # Keywords are interned so set operations against the index mostly
+    # compare by identity.
+    return frozenset(
+        sys.intern(token)
+        for token in _TOKEN_RE.findall(text.lower())
+        if token not in _STOP_WORDS
+    )
+
 
 class IntentRouter:
     """Routes user messages to relevant tools using keyword matching.
@@ -41,24 +102,37 @@ class IntentRouter:
 
     def _build_keyword_index(self) -> None:
         """Build keyword index from manifest descriptions and tags."""
-        self.keyword_index: dict[str, list[str]] = {}
+        self.keyword_index: dict[str, frozenset[str]] = {}
+        self.keyword_sizes: dict[str, int] = {}
+        # Inverted index: keyword -> names of skills containing it, ordered by
+        # keyword-set size (sizes kept in a parallel list for bisection)
+        self._inverted: dict[str, list[str]] = {}
+        self._inverted_sizes: dict[str, list[int]] = {}
 
         for manifest in self.manifests:
-            keywords = set()
+            keywords: set[str] = set()
 
             # Extract keywords from description
             desc_keywords = self._extract_keywords(manifest.description)
             keywords.update(desc_keywords)
 
             # Add tags as keywords
-            keywords.update(tag.lower() for tag in manifest.tags)
+            keywords.update(sys.intern(tag.lower()) for tag in manifest.tags)
+
+            # Store keywords for this skill; frozen so scoring can use them as-is
+            self.keyword_index[manifest.name] = frozenset(keywords)
+            self.keyword_sizes[manifest.name] = len(keywords)
 
-            # Store keywords for this skill
-            self.keyword_index[manifest.name] = list(keywords)
+            for keyword in keywords:
+                self._inverted.setdefault(keyword, []).append(manifest.name)
+
+        for keyword, skill_names in self._inverted.items():
+            skill_names.sort(key=self.keyword_sizes.__getitem__)
+            self._inverted_sizes[keyword] = [self.keyword_sizes[name] for name in skill_names]
 
         logger.debug("Built keyword index for %d skills", len(self.keyword_index))
 
-    def _extract_keywords(self, text: str) -> set[str]:
+    def _extract_keywords(self, text: str) -> frozenset[str]:
         """Extract keywords from text.
 
         Args:
@@ -67,50 +141,9 @@ class IntentRouter:
         Returns:
             Set of keywords.
         """
-        # Simple keyword extraction: split on whitespace and punctuation
-        # Remove common Chinese and English stop words
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "这个",
-            "那个",
-            "的",
-            "了",
-            "在",
-            "是",
-            "和",
-        }
-
-        # Split English words and keep individual Chinese characters as keywords
-        # This is a simple approach; for production, use jieba or similar
-        words = []
+        return _extract_keywords(text)
 
-        # Extract English words
-        english_words = re.findall(r"[a-zA-Z]+", text.lower())
-        words.extend(english_words)
-
-        # Extract Chinese characters (each character as a keyword)
-        chinese_chars = re.findall(r"[\u4e00-\u9fff]", text)
-        words.extend(chinese_chars)
-
-        # Filter stop words and short English words
-        keywords = {w for w in words if (len(w) > 1 or ord(w[0]) > 127) and w not in stop_words}
-
-        return keywords
-
-    def _score_skill(self, skill_name: str, user_keywords: set[str]) -> float:
+    def _score_skill(self, skill_name: str, user_keywords: frozenset[str]) -> float:
         """Score a skill's relevance to user keywords.
 
         Args:
@@ -120,16 +153,63 @@ class IntentRouter:
         Returns:
             Relevance score (0-1).
         """
-        skill_keywords = set(self.keyword_index.get(skill_name, []))
+        skill_keywords = self.keyword_index.get(skill_name, frozenset())
 
         if not skill_keywords or not user_keywords:
             return 0.0
 
-        # Calculate Jaccard similarity
-        intersection = skill_keywords & user_keywords
-        union = skill_keywords | user_keywords
+        # Calculate Jaccard similarity; |A ∪ B| = |A| + |B| - |A ∩ B|
+        intersection = len(skill_keywords & user_keywords)
+        union = self.keyword_sizes[skill_name] + len(user_keywords) - intersection
+
+        return intersection / union if union else 0.0
 
-        return len(intersection) / len(union) if union else 0.0
+    def _score_all(self, user_keywords: frozenset[str]) -> dict[str, float]:
+        """Score all skills sharing at least one keyword with the user.
+
+        Walks the inverted index, so the cost is proportional to the matched
+        keywords rather than to the number of skills. With a positive
+        `match_threshold`, skills whose keyword count bounds their Jaccard
+        score (`min(|A|, |B|) / max(|A|, |B|)`) below the threshold are
+        skipped without being counted.
+
+        Args:
+            user_keywords: Keywords extracted from user message.
+
+        Returns:
+            Mapping of skill name to relevance score (0-1). Skills without
+            any shared keyword are omitted and score 0.
+        """
+        num_user_keywords = len(user_keywords)
+        threshold = self.match_threshold
+
+        if threshold > 0:
+            # Only skills with threshold * |B| <= |A| <= |B| / threshold can pass.
+            # Sizes are integers, so round the bounds outward with a small
+            # tolerance; float error must never drop a skill scoring exactly
+            # the threshold (the final `>=` check in route_tools is exact).
+            min_size = math.ceil(threshold * num_user_keywords - _BOUND_TOLERANCE)
+            max_size = math.floor(num_user_keywords / threshold + _BOUND_TOLERANCE)
+
+        counts: Counter[str] = Counter()
+        for keyword in user_keywords:
+            skill_names = self._inverted.get(keyword)
+            if not skill_names:
+                continue
+
+            if threshold > 0:
+                sizes = self._inverted_sizes[keyword]
+                lo = bisect_left(sizes, min_size)
+                hi = bisect_right(sizes, max_size)
+                skill_names = skill_names[lo:hi]
+
+            counts.update(skill_names)
+
+        return {
+            skill_name: intersection
+            / (self.keyword_sizes[skill_name] + num_user_keywords - intersection)
+            for skill_name, intersection in counts.items()
+        }
 
     def route_tools(
         self,
@@ -159,29 +239,32 @@ class IntentRouter:
             logger.debug("No keywords found, returning first %d tools", self.max_tools)
             return tools[: self.max_tools]
 
-        # Score each tool
+        # Score matching skills once, then look up each tool
+        scores = self._score_all(user_keywords)
         scored_tools: list[tuple[StructuredTool, float]] = []
 
         for tool in tools:
-            # Get skill name from tool name (convert back from snake_case)
-            skill_name = tool.name.replace("_", "-")
+            # Registry-built tools carry their skill name in metadata
+            skill_name = tool.metadata.get("skill_name") if tool.metadata else None
 
-            # Try to get manifest if function provided
-            if get_manifest:
-                manifest = get_manifest(skill_name)
-                if manifest:
-                    skill_name = manifest.name
+            if skill_name is None:
+                # Get skill name from tool name (convert back from snake_case)
+                skill_name = tool.name.replace("_", "-")
 
-            score = self._score_skill(skill_name, user_keywords)
+                # Try to get manifest if function provided
+                if get_manifest:
+                    manifest = get_manifest(skill_name)
+                    if manifest:
+                        skill_name = manifest.name
+
+            score = scores.get(skill_name, 0.0)
 
             if score >= self.match_threshold:
                 scored_tools.append((tool, score))
 
-        # Sort by score (descending)
-        scored_tools.sort(key=lambda x: x[1], reverse=True)
-
-        # Return top tools
-        selected_tools = [tool for tool, _ in scored_tools[: self.max_tools]]
+        # Return top tools by score (descending); ties keep their original order
+        top_tools = heapq.nlargest(self.max_tools, scored_tools, key=itemgetter(1))
+        selected_tools = [tool for tool, _ in top_tools]
 
         logger.info(
             "Routed to %d tools from %d candidates for message: %s",
@@ -206,4 +289,4 @@ class IntentRouter:
         Returns:
             List of keywords for the skill.
         """
-        return self.keyword_index.get(skill_name, [])
+        return list(self.keyword_index.get(skill_name, ()))
@@ -1,12 +1,36 @@
 """File storage for skill outputs."""
 
 import logging
-import uuid
+import mmap
+import os
+import secrets
+import shutil
+import sqlite3
+import threading
+from collections.abc import Iterable
 from pathlib import Path
-from typing import BinaryIO
+from types import TracebackType
+from typing import BinaryIO, Self
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+_INDEX_DB = "index.db"
+_COPY_BUFFER_SIZE = 1 << 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    file_id TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    suffix TEXT NOT NULL
+)
+"""
+
+# PRAGMA user_version: 1 = legacy .meta sidecars imported, 2 = files sharded
+_SCHEMA_VERSION = 2
+
 
 class FileStore:
     """File storage for skill execution outputs.
@@ -23,8 +47,149 @@ class FileStore:
         """
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+
+        # Metadata lives in one SQLite database shared by all instances and
+        # processes using this directory. Tools store files from worker
+        # threads, so the connection is shared behind a lock.
+        self._db = sqlite3.connect(
+            self.base_dir / _INDEX_DB, isolation_level=None, check_same_thread=False
+        )
+        self._db_lock = threading.Lock()
+        self._init_db()
+
+        # file_id -> content path, filled as lookups hit the database
+        self._index: dict[str, Path] = {}
         logger.info("File store initialized at: %s", self.base_dir)
 
+    def close(self) -> None:
+        """Close the metadata database connection."""
+        with self._db_lock:
+            self._db.close()
+
+    def __enter__(self) -> Self:
+        """Enter the context manager.
+
+        Returns:
+            This file store.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the store on exit from the context manager."""
+        self.close()
+
+    def _init_db(self) -> None:
+        """Create the metadata table and migrate legacy storage layouts."""
+        with self._db_lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(_SCHEMA)
+
+            (version,) = self._db.execute("PRAGMA user_version").fetchone()
+            if version >= _SCHEMA_VERSION:
+                return
+
+            # Serialize migrations across processes sharing the directory
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                (version,) = self._db.execute("PRAGMA user_version").fetchone()
+                if version < 1:
+                    self._migrate_sidecars()
+                if version < 2:
+                    self._migrate_to_shards()
+                self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _migrate_sidecars(self) -> None:
+        """Move metadata from per-file `.meta` sidecars into the database."""
+        migrated = 0
+
+        # One directory scan maps each file ID to its sidecar and content
+        # suffix (content is stored as <file_id><suffix>), instead of a glob
+        # per sidecar
+        sidecars: list[Path] = []
+        suffixes: dict[str, str] = {}
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                stem, dot, ext = entry.name.partition(".")
+                if ext == "meta":
+                    sidecars.append(Path(entry.path))
+                elif entry.is_file():
+                    suffixes[stem] = f"{dot}{ext}"
+
+        for meta_file in sidecars:
+            file_id = meta_file.stem
+            metadata = orjson.loads(meta_file.read_bytes())
+            suffix = suffixes.get(file_id, "")
+
+            self._db.execute(
+                "INSERT OR IGNORE INTO files VALUES (?, ?, ?, ?)",
+                (file_id, metadata["filename"], metadata["content_type"], suffix),
+            )
+            meta_file.unlink(missing_ok=True)
+            migrated += 1
+
+        if migrated:
+            logger.info("Migrated %d metadata sidecars to %s", migrated, _INDEX_DB)
+
+    def _migrate_to_shards(self) -> None:
+        """Move files stored flat in the base directory into shard directories."""
+        file_ids = {row[0] for row in self._db.execute("SELECT file_id FROM files")}
+        moved = 0
+
+        with os.scandir(self.base_dir) as entries:
+            flat_files = [
+                (entry.name, entry.name.partition(".")[0])
+                for entry in entries
+                if entry.is_file()
+            ]
+
+        for name, file_id in flat_files:
+            if file_id not in file_ids:
+                continue
+
+            shard_dir = self._shard_dir(file_id)
+            shard_dir.mkdir(exist_ok=True)
+            (self.base_dir / name).replace(shard_dir / name)
+            moved += 1
+
+        if moved:
+            logger.info("Moved %d files into shard directories", moved)
+
+    def _shard_dir(self, file_id: str) -> Path:
+        """Get the shard directory for a file ID.
+
+        Files are spread over subdirectories named by the first two
+        characters of their ID, keeping each directory small.
+
+        Args:
+            file_id: The file ID.
+
+        Returns:
+            Shard directory path.
+        """
+        return self.base_dir / file_id[:2]
+
+    def _content_path(self, file_id: str, suffix: str) -> Path:
+        """Get the content path for a file ID.
+
+        Args:
+            file_id: The file ID.
+            suffix: File extension, including the dot.
+
+        Returns:
+            Path to the file content.
+        """
+        return self._shard_dir(file_id) / f"{file_id}{suffix}"
+
     def store(
         self,
         file_data: bytes | BinaryIO,
@@ -42,40 +207,139 @@ class FileStore:
         Returns:
             Unique file ID.
         """
-        # Generate unique file ID
-        file_id = str(uuid.uuid4())
-
-        # Determine file extension
-        ext = ""
-        if filename:
-            ext = Path(filename).suffix
-
-        # Create file path
-        file_path = self.base_dir / f"{file_id}{ext}"
+        file_id, file_path = self._new_file_path(filename)
 
         # Write file
         if isinstance(file_data, bytes):
             file_path.write_bytes(file_data)
         else:
+            # Copy in chunks so large uploads are never fully buffered
             with file_path.open("wb") as f:
-                f.write(file_data.read())
+                shutil.copyfileobj(file_data, f, _COPY_BUFFER_SIZE)
 
-        # Store metadata (could be in a database in production)
-        metadata_path = self.base_dir / f"{file_id}.meta"
-        metadata = {
-            "file_id": file_id,
-            "filename": filename or f"{file_id}{ext}",
-            "content_type": content_type or "application/octet-stream",
-        }
+        self._write_metadata(file_id, file_path, filename, content_type)
+        self._index[file_id] = file_path
 
-        import json
+        return file_id
 
-        metadata_path.write_text(json.dumps(metadata))
+    def store_stream(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        filename: str | None = None,
+        content_type: str | None = None,
+    ) -> str:
+        """Store a file from an iterable of byte chunks and return its ID.
 
-        logger.info("Stored file: %s (original: %s)", file_id, filename)
+        Chunks are written to disk as they arrive, so the full content is
+        never held in memory.
+
+        Args:
+            chunks: File content as an iterable of byte chunks.
+            filename: Original filename (optional).
+            content_type: MIME type (optional).
+
+        Returns:
+            Unique file ID.
+        """
+        file_id, file_path = self._new_file_path(filename)
+
+        try:
+            with file_path.open("wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+        except BaseException:
+            # Don't leave a partial file behind
+            file_path.unlink(missing_ok=True)
+            raise
+
+        self._write_metadata(file_id, file_path, filename, content_type)
+        self._index[file_id] = file_path
 
         return file_id
 
+    def _new_file_path(self, filename: str | None) -> tuple[str, Path]:
+        """Allocate a file ID and destination path.
+
+        Args:
+            filename: Original filename (optional).
+
+        Returns:
+            Tuple of `(file_id, file_path)`.
+        """
+        # Generate unique file ID (128 random bits, hex encoded)
+        file_id = secrets.token_hex(16)
+
+        # Determine file extension (a bare trailing dot is not an extension)
+        ext = os.path.splitext(filename)[1] if filename else ""
+        if ext == ".":
+            ext = ""
+
+        # Create file path
+        self._shard_dir(file_id).mkdir(exist_ok=True)
+        return file_id, self._content_path(file_id, ext)
+
+    def _write_metadata(
+        self,
+        file_id: str,
+        file_path: Path,
+        filename: str | None,
+        content_type: str | None,
+    ) -> None:
+        """Record metadata for a stored file.
+
+        Args:
+            file_id: The file ID.
+            file_path: Path of the stored file.
+            filename: Original filename (optional).
+            content_type: MIME type (optional).
+        """
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                (
+                    file_id,
+                    filename or file_path.name,
+                    content_type or "application/octet-stream",
+                    file_path.suffix,
+                ),
+            )
+
+        logger.info("Stored file: %s (original: %s)", file_id, filename)
+
+    def path_for(self, file_id: str) -> Path | None:
+        """Get the on-disk path of a stored file.
+
+        Args:
+            file_id: The file ID.
+
+        Returns:
+            Path to the file content, or `None` if not found.
+        """
+        file_path = self._index.get(file_id)
+
+        if file_path is not None:
+            if file_path.is_file():
+                return file_path
+
+            # Removed by another store instance or process
+            self._index.pop(file_id, None)
+
+        # Not cached yet (e.g. stored by another instance); ask the database
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT suffix FROM files WHERE file_id = ?", (file_id,)
+            ).fetchone()
+
+        file_path = self._content_path(file_id, row[0]) if row else None
+
+        if file_path is None or not file_path.is_file():
+            logger.warning("File not found: %s", file_id)
+            return None
+
+        self._index[file_id] = file_path
+        return file_path
+
     def retrieve(self, file_id: str) -> bytes | None:
         """Retrieve file content by ID.
 
@@ -85,21 +349,40 @@ class FileStore:
         Returns:
             File content as bytes, or `None` if not found.
         """
-        # Find file with any extension
-        matches = list(self.base_dir.glob(f"{file_id}.*"))
-
-        # Filter out .meta files
-        matches = [m for m in matches if m.suffix != ".meta"]
+        file_path = self.path_for(file_id)
 
-        if not matches:
-            logger.warning("File not found: %s", file_id)
+        if file_path is None:
             return None
 
-        file_path = matches[0]
         logger.debug("Retrieving file: %s", file_path)
 
         return file_path.read_bytes()
 
+    def retrieve_mmap(self, file_id: str) -> mmap.mmap | None:
+        """Map file content into memory read-only, without copying it.
+
+        The caller owns the mapping and should close it when done.
+
+        Args:
+            file_id: The file ID.
+
+        Returns:
+            Read-only memory map of the file content, or `None` if not found.
+
+        Raises:
+            ValueError: If the file is empty (zero-length files cannot be mapped).
+        """
+        file_path = self.path_for(file_id)
+
+        if file_path is None:
+            return None
+
+        logger.debug("Mapping file: %s", file_path)
+
+        # The mapping stays valid after the descriptor is closed
+        with file_path.open("rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
     def get_metadata(self, file_id: str) -> dict[str, str] | None:
         """Get file metadata by ID.
 
@@ -109,15 +392,17 @@ class FileStore:
         Returns:
             File metadata dictionary, or `None` if not found.
         """
-        metadata_path = self.base_dir / f"{file_id}.meta"
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT file_id, filename, content_type FROM files WHERE file_id = ?",
+                (file_id,),
+            ).fetchone()
 
-        if not metadata_path.exists():
+        if row is None:
             logger.warning("Metadata not found: %s", file_id)
             return None
 
-        import json
-
-        return json.loads(metadata_path.read_text())
+        return _row_to_metadata(row)
 
     def delete(self, file_id: str) -> bool:
         """Delete a file by ID.
@@ -128,16 +413,22 @@ class FileStore:
         Returns:
             `True` if file was deleted, `False` if not found.
         """
-        # Find and delete file
-        matches = list(self.base_dir.glob(f"{file_id}.*"))
+        self._index.pop(file_id, None)
+
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT suffix FROM files WHERE file_id = ?", (file_id,)
+            ).fetchone()
+            if row is not None:
+                self._db.execute("DELETE FROM files WHERE file_id = ?", (file_id,))
 
-        if not matches:
+        if row is None:
             logger.warning("File not found for deletion: %s", file_id)
             return False
 
-        for file_path in matches:
-            file_path.unlink()
-            logger.info("Deleted file: %s", file_path)
+        file_path = self._content_path(file_id, row[0])
+        file_path.unlink(missing_ok=True)
+        logger.info("Deleted file: %s", file_path)
 
         return True
 
@@ -147,13 +438,20 @@ class FileStore:
         Returns:
             List of file metadata dictionaries.
         """
-        metadata_files = self.base_dir.glob("*.meta")
-        files = []
+        with self._db_lock:
+            rows = self._db.execute("SELECT file_id, filename, content_type FROM files").fetchall()
 
-        for meta_file in metadata_files:
-            import json
+        return [_row_to_metadata(row) for row in rows]
 
-            metadata = json.loads(meta_file.read_text())
-            files.append(metadata)
 
-        return files
+def _row_to_metadata(row: tuple[str, str, str]) -> dict[str, str]:
+    """Convert a `files` row into a metadata dictionary.
+
+    Args:
+        row: `(file_id, filename, content_type)` row.
+
+    Returns:
+        File metadata dictionary.
+    """
+    file_id, filename, content_type = row
+    return {"file_id": file_id, "filename": filename, "content_type": content_type}
@@ -0,0 +1,73 @@
+"""Unit tests for the agent core."""
+
+from typing import Any
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage, BaseMessage, SystemMessage
+
+from skillslike.agent.core import _BoundedMemorySaver, _build_agent, invoke_agent
+
+
+class RecordingChatModel(FakeMessagesListChatModel):
+    """Fake chat model that records the messages it was called with."""
+
+    calls: list[list[BaseMessage]] = []
+
+    def invoke(self, input: Any, *args: Any, **kwargs: Any) -> BaseMessage:  # noqa: A002
+        """Record the converted input and return the next canned response."""
+        self.calls.append(self._convert_input(input).to_messages())
+        return super().invoke(input, *args, **kwargs)
+
+
+def _build(checkpointer: _BoundedMemorySaver, responses: int = 2) -> tuple[Any, RecordingChatModel]:
+    """Build a tool-less agent around a recording fake model.
+
+    Args:
+        checkpointer: Checkpointer for the compiled graph.
+        responses: Number of canned replies the model can give.
+
+    Returns:
+        Tuple of (compiled graph, fake model).
+    """
+    model = RecordingChatModel(
+        responses=[AIMessage(content=f"reply {i}") for i in range(responses)],
+        calls=[],
+    )
+    app = _build_agent([], model=model, system_prompt="Be brief.", checkpointer=checkpointer)
+    return app, model
+
+
+def test_system_prompt_sent_on_every_turn() -> None:
+    """Test that follow-up turns on a thread still start with the system prompt."""
+    app, model = _build(_BoundedMemorySaver(max_threads=8))
+
+    invoke_agent(app, "first", thread_id="t1")
+    result = invoke_agent(app, "second", thread_id="t1")
+
+    assert result["text"] == "reply 1"
+    assert len(model.calls) == 2
+    for call in model.calls:
+        assert isinstance(call[0], SystemMessage)
+        assert call[0].content == "Be brief."
+    # The second turn carries the thread history after the system prompt
+    assert [m.content for m in model.calls[1][1:]] == ["first", "reply 0", "second"]
+
+
+def test_bounded_saver_evicts_oldest_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the saver only keeps the most recently written threads."""
+    saver = _BoundedMemorySaver(max_threads=2)
+    app, _ = _build(saver, responses=4)
+    # Eviction must only touch the evicted thread's keys, not scan them all
+    monkeypatch.setattr(saver, "delete_thread", None)
+
+    for thread_id in ("a", "b", "a", "c"):
+        invoke_agent(app, "hi", thread_id=thread_id)
+
+    # "b" is the least recently written thread once "c" arrives
+    assert set(saver.storage) == {"a", "c"}
+    assert all(key[0] != "b" for key in saver.blobs)
+    assert all(key[0] != "b" for key in saver.writes)
+    assert any(key[0] == "a" for key in saver.writes)
+    assert app.get_state({"configurable": {"thread_id": "b"}}).values == {}
+    assert len(app.get_state({"configurable": {"thread_id": "a"}}).values["messages"]) == 4
@@ -0,0 +1,129 @@
+"""Endpoint tests for the chat API."""
+
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+
+from skillslike.agent import core
+from skillslike.api import main
+
+
+class RecordingChatModel(FakeMessagesListChatModel):
+    """Fake chat model that records the messages it was called with."""
+
+    calls: list[list[BaseMessage]] = []
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "RecordingChatModel":
+        """Ignore tool binding; the canned replies never call tools."""
+        return self
+
+    async def ainvoke(self, input: Any, *args: Any, **kwargs: Any) -> BaseMessage:  # noqa: A002
+        """Record the converted input and return the next canned response."""
+        self.calls.append(self._convert_input(input).to_messages())
+        return await super().ainvoke(input, *args, **kwargs)
+
+
+@pytest.fixture
+def model() -> RecordingChatModel:
+    """Create the fake model served to the agent."""
+    return RecordingChatModel(
+        responses=[AIMessage(content=f"reply {i}") for i in range(4)],
+        calls=[],
+    )
+
+
+@pytest.fixture
+def client(
+    model: RecordingChatModel, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[TestClient]:
+    """Start the app with no skills, an empty cache, and the fake model."""
+    monkeypatch.setenv("SKILLS_DIR", str(tmp_path / "skills"))
+    monkeypatch.setenv("FILE_STORE_DIR", str(tmp_path / "files"))
+    monkeypatch.setattr(core, "_get_model", lambda *args: model)
+    monkeypatch.setattr(core, "_agent_cache", {})
+    main.response_cache.clear()
+
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+    main.response_cache.clear()
+
+
+def test_cached_response_thread_can_be_resumed(
+    client: TestClient, model: RecordingChatModel
+) -> None:
+    """Test that a cache hit returns a thread that already holds the exchange."""
+    first = client.post("/api/chat", json={"message": "hello"}).json()
+    cached = client.post("/api/chat", json={"message": "Hello "}).json()
+
+    assert cached["text"] == first["text"] == "reply 0"
+    assert cached["thread_id"] != first["thread_id"]
+    assert len(model.calls) == 1
+
+    follow_up = client.post(
+        "/api/chat", json={"message": "and then?", "thread_id": cached["thread_id"]}
+    ).json()
+
+    assert follow_up["text"] == "reply 1"
+    # The seeded turn records the message as this client sent it
+    assert [m.content for m in model.calls[1][1:]] == ["Hello ", "reply 0", "and then?"]
+
+
+def test_tool_results_are_not_cached(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that replies with tool side effects are recomputed every time."""
+    calls = 0
+
+    async def fake_ainvoke_agent(app: Any, message: str, *, thread_id: str) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        return {"text": "made an image", "file_ids": [f"file-{calls}"], "used_tools": True}
+
+    monkeypatch.setattr(main, "ainvoke_agent", fake_ainvoke_agent)
+
+    first = client.post("/api/chat", json={"message": "draw a cat"}).json()
+    second = client.post("/api/chat", json={"message": "draw a cat"}).json()
+
+    assert calls == 2
+    assert first["files"] == ["file-1"]
+    assert second["files"] == ["file-2"]
+    assert len(main.response_cache) == 0
+
+
+def test_chat_stream_sends_sse_events(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the token/done framing of the streaming endpoint and that it is not gzipped."""
+    # Long enough to pass the gzip middleware's minimum size
+    tokens = [f"token {i} " * 20 for i in range(10)]
+
+    async def fake_astream_agent(
+        app: Any, message: str, *, thread_id: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        for token in tokens:
+            yield {"type": "token", "text": token}
+        yield {"type": "done", "file_ids": ["f1"]}
+
+    monkeypatch.setattr(main, "astream_agent", fake_astream_agent)
+
+    with client.stream(
+        "POST",
+        "/api/chat/stream",
+        json={"message": "hello", "thread_id": "t1"},
+        headers={"Accept-Encoding": "gzip"},
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "content-encoding" not in response.headers
+        body = response.read()
+
+    frames = body.split(b"\n\n")
+    assert frames[-1] == b""
+    assert all(frame.startswith(b"data: ") for frame in frames[:-1])
+    events = [orjson.loads(frame.removeprefix(b"data: ")) for frame in frames[:-1]]
+
+    assert events[:-1] == [{"type": "token", "text": token} for token in tokens]
+    assert events[-1] == {"type": "done", "files": ["f1"], "thread_id": "t1"}
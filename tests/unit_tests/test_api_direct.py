@@ -29,12 +29,8 @@ print(f"📦 Payload: {payload}\n")
 
 try:
     print("⏳ Sending request...")
-    response = httpx.post(
-        endpoint,
-        headers=headers,
-        json=payload,
-        timeout=90.0,
-    )
+    with httpx.Client(http2=True, timeout=90.0) as client:
+        response = client.post(endpoint, headers=headers, json=payload)
 
     print(f"✅ Status code: {response.status_code}")
     print("📄 Response headers:")
@@ -1,5 +1,9 @@
 """Unit tests for file storage."""
 
+import io
+import json
+import shutil
+import sqlite3
 import tempfile
 from pathlib import Path
 
@@ -7,12 +11,15 @@ import pytest
 
 from skillslike.storage.file_store import FileStore
 
+SHARED_FILES = {"file1.txt": b"content1", "file2.txt": b"content2"}
+
 
 @pytest.fixture
-def temp_store_dir() -> Path:
+def temp_store_dir(request: pytest.FixtureRequest) -> Path:
     """Create a temporary directory for file store."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    tmpdir = Path(tempfile.mkdtemp())
+    request.addfinalizer(lambda: shutil.rmtree(tmpdir, ignore_errors=True))
+    return tmpdir
 
 
 @pytest.fixture
@@ -21,6 +28,22 @@ def file_store(temp_store_dir: Path) -> FileStore:
     return FileStore(temp_store_dir)
 
 
+@pytest.fixture(scope="module")
+def shared_store(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[FileStore, dict[str, str]]:
+    """Create a pre-populated FileStore shared by read-only tests.
+
+    Returns the store and a mapping of filename to file ID.
+    """
+    store = FileStore(tmp_path_factory.mktemp("shared_store"))
+    file_ids = {
+        name: store.store(content, filename=name, content_type="text/plain")
+        for name, content in SHARED_FILES.items()
+    }
+    return store, file_ids
+
+
 def test_store_initialization(temp_store_dir: Path) -> None:
     """Test FileStore initialization."""
     store = FileStore(temp_store_dir)
@@ -38,14 +61,68 @@ def test_store_bytes(file_store: FileStore) -> None:
     assert len(file_id) > 0
 
 
-def test_retrieve_file(file_store: FileStore) -> None:
+def test_store_file_object(file_store: FileStore) -> None:
+    """Test storing a file-like object."""
+    file_id = file_store.store(io.BytesIO(b"streamed content"), filename="test.bin")
+
+    assert file_store.retrieve(file_id) == b"streamed content"
+
+
+def test_store_stream(file_store: FileStore) -> None:
+    """Test storing a file from byte chunks."""
+    file_id = file_store.store_stream(
+        iter([b"chunk one ", b"chunk two"]),
+        filename="image.png",
+        content_type="image/png",
+    )
+
+    assert file_store.retrieve(file_id) == b"chunk one chunk two"
+    assert file_store.get_metadata(file_id)["content_type"] == "image/png"
+
+
+def test_retrieve_file(shared_store: tuple[FileStore, dict[str, str]]) -> None:
     """Test retrieving stored file."""
-    data = b"test content"
-    file_id = file_store.store(data, filename="test.txt")
+    file_store, file_ids = shared_store
+
+    retrieved = file_store.retrieve(file_ids["file1.txt"])
+
+    assert retrieved == SHARED_FILES["file1.txt"]
+
+
+def test_retrieve_mmap(shared_store: tuple[FileStore, dict[str, str]]) -> None:
+    """Test memory-mapping stored file content."""
+    file_store, file_ids = shared_store
+
+    mapped = file_store.retrieve_mmap(file_ids["file1.txt"])
+
+    assert mapped is not None
+    with mapped:
+        assert mapped[:] == SHARED_FILES["file1.txt"]
+    assert file_store.retrieve_mmap("nonexistent-id") is None
 
-    retrieved = file_store.retrieve(file_id)
 
-    assert retrieved == data
+def test_path_for(shared_store: tuple[FileStore, dict[str, str]]) -> None:
+    """Test resolving the on-disk path of a stored file."""
+    file_store, file_ids = shared_store
+
+    path = file_store.path_for(file_ids["file1.txt"])
+
+    assert path is not None
+    assert path.read_bytes() == SHARED_FILES["file1.txt"]
+    assert file_store.path_for("nonexistent-id") is None
+
+
+def test_index_tracks_other_instances(temp_store_dir: Path) -> None:
+    """Test that lookups see files stored and deleted by another instance."""
+    reader = FileStore(temp_store_dir)
+    writer = FileStore(temp_store_dir)
+    assert reader.path_for("missing") is None  # builds the reader's index
+
+    file_id = writer.store(b"content", filename="test.txt")
+    assert reader.retrieve(file_id) == b"content"
+
+    writer.delete(file_id)
+    assert reader.path_for(file_id) is None
 
 
 def test_retrieve_nonexistent_file(file_store: FileStore) -> None:
@@ -55,16 +132,16 @@ def test_retrieve_nonexistent_file(file_store: FileStore) -> None:
     assert retrieved is None
 
 
-def test_get_metadata(file_store: FileStore) -> None:
+def test_get_metadata(shared_store: tuple[FileStore, dict[str, str]]) -> None:
     """Test getting file metadata."""
-    data = b"test content"
-    file_id = file_store.store(data, filename="test.txt", content_type="text/plain")
+    file_store, file_ids = shared_store
+    file_id = file_ids["file1.txt"]
 
     metadata = file_store.get_metadata(file_id)
 
     assert metadata is not None
     assert metadata["file_id"] == file_id
-    assert metadata["filename"] == "test.txt"
+    assert metadata["filename"] == "file1.txt"
     assert metadata["content_type"] == "text/plain"
 
 
@@ -90,11 +167,9 @@ def test_delete_nonexistent_file(file_store: FileStore) -> None:
     assert result is False
 
 
-def test_list_files(file_store: FileStore) -> None:
+def test_list_files(shared_store: tuple[FileStore, dict[str, str]]) -> None:
     """Test listing all files."""
-    # Store multiple files
-    file_store.store(b"content1", filename="file1.txt")
-    file_store.store(b"content2", filename="file2.txt")
+    file_store, _ = shared_store
 
     files = file_store.list_files()
 
@@ -103,11 +178,47 @@ def test_list_files(file_store: FileStore) -> None:
     assert all("filename" in f for f in files)
 
 
+def test_migrates_legacy_metadata_sidecars(temp_store_dir: Path) -> None:
+    """Test that legacy .meta sidecars are imported into the index."""
+    (temp_store_dir / "legacy-id.txt").write_bytes(b"legacy")
+    (temp_store_dir / "legacy-id.meta").write_text(
+        json.dumps(
+            {"file_id": "legacy-id", "filename": "old.txt", "content_type": "text/plain"}
+        )
+    )
+
+    store = FileStore(temp_store_dir)
+
+    assert store.get_metadata("legacy-id") == {
+        "file_id": "legacy-id",
+        "filename": "old.txt",
+        "content_type": "text/plain",
+    }
+    assert store.retrieve("legacy-id") == b"legacy"
+    assert not (temp_store_dir / "legacy-id.meta").exists()
+    # Flat legacy files are moved into shard directories
+    assert (temp_store_dir / "le" / "legacy-id.txt").exists()
+
+
 def test_store_preserves_extension(file_store: FileStore) -> None:
     """Test that file extension is preserved."""
     data = b"test content"
     file_id = file_store.store(data, filename="document.pdf")
 
-    # Check that file exists with .pdf extension
-    matches = list(file_store.base_dir.glob(f"{file_id}.pdf"))
+    # Check that file exists with .pdf extension in its shard directory
+    matches = list((file_store.base_dir / file_id[:2]).glob(f"{file_id}.pdf"))
     assert len(matches) == 1
+
+
+def test_close_releases_database_connection(temp_store_dir: Path) -> None:
+    """Test that closing the store (or leaving its context) closes the index database."""
+    with FileStore(temp_store_dir) as store:
+        file_id = store.store(b"data", filename="a.txt")
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.get_metadata(file_id)
+
+    # The data is still there for a new store on the same directory
+    reopened = FileStore(temp_store_dir)
+    assert reopened.retrieve(file_id) == b"data"
+    reopened.close()
@@ -0,0 +1,325 @@
+"""Unit tests for shared HTTP helpers."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from skillslike.executors import custom_executor, http, image_gen_executor
+from skillslike.executors.http import MAX_ATTEMPTS, acall_with_retry, call_with_retry
+from skillslike.executors.image_gen_executor import ImageGenExecutor
+from skillslike.models.manifest import SkillManifest
+from skillslike.storage import FileStore
+
+IMAGE_URL = "https://images.example.com/generated.png"
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record retry delays instead of sleeping."""
+    delays: list[float] = []
+    monkeypatch.setattr(http.time, "sleep", delays.append)
+    return delays
+
+
+def _status_error(status_code: int, headers: dict[str, str] | None = None) -> None:
+    """Raise the `HTTPStatusError` for a response with the given status.
+
+    Args:
+        status_code: Response status code.
+        headers: Optional response headers.
+
+    Raises:
+        httpx.HTTPStatusError: Always, for 4xx/5xx statuses.
+    """
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    response.raise_for_status()
+
+
+def test_call_with_retry_honors_retry_after(no_sleep: list[float]) -> None:
+    """Test that a 429 is retried after the Retry-After delay."""
+    calls: list[int] = []
+
+    def func() -> str:
+        calls.append(1)
+        if len(calls) == 1:
+            _status_error(429, {"Retry-After": "2"})
+        return "ok"
+
+    assert call_with_retry(func) == "ok"
+    assert len(calls) == 2
+    assert no_sleep == [2.0]
+
+
+def test_call_with_retry_gives_up(no_sleep: list[float]) -> None:
+    """Test that retries stop after MAX_ATTEMPTS."""
+    calls: list[int] = []
+
+    def func() -> str:
+        calls.append(1)
+        _status_error(503)
+        return "unreachable"
+
+    with pytest.raises(httpx.HTTPStatusError):
+        call_with_retry(func)
+
+    assert len(calls) == MAX_ATTEMPTS
+
+
+def test_call_with_retry_skips_non_retryable_status(no_sleep: list[float]) -> None:
+    """Test that client errors are raised without retrying."""
+    calls: list[int] = []
+
+    def func() -> str:
+        calls.append(1)
+        _status_error(400)
+        return "unreachable"
+
+    with pytest.raises(httpx.HTTPStatusError):
+        call_with_retry(func)
+
+    assert len(calls) == 1
+    assert no_sleep == []
+
+
+def test_acall_with_retry_retries_timeouts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the async variant retries transient errors with backoff."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(http.asyncio, "sleep", fake_sleep)
+    calls: list[int] = []
+
+    async def func() -> str:
+        calls.append(1)
+        if len(calls) < MAX_ATTEMPTS:
+            msg = "timed out"
+            raise httpx.ReadTimeout(msg)
+        return "ok"
+
+    assert asyncio.run(acall_with_retry(func)) == "ok"
+    assert len(calls) == MAX_ATTEMPTS
+    assert delays == [0.5, 1.0]
+
+
+def test_async_client_is_created_per_event_loop() -> None:
+    """Test that each event loop gets its own client, reused within the loop."""
+
+    async def get_clients() -> tuple[httpx.AsyncClient, httpx.AsyncClient]:
+        return http.get_async_client(), http.get_async_client()
+
+    async def get_and_close_client() -> httpx.AsyncClient:
+        client = http.get_async_client()
+        await http.aclose_clients()
+        return client
+
+    # The first loop ends without closing its client, like a one-off asyncio.run
+    first, again = asyncio.run(get_clients())
+    second = asyncio.run(get_and_close_client())
+
+    assert first is again
+    assert second is not first
+    assert second.is_closed
+
+
+def test_generation_semaphore_works_across_event_loops() -> None:
+    """Test that generations can contend for the semaphore on successive loops."""
+
+    async def generate() -> None:
+        async with image_gen_executor._get_generation_semaphore():
+            await asyncio.sleep(0)
+
+    async def generate_many() -> None:
+        # More tasks than permits, so some have to wait on the semaphore
+        await asyncio.gather(
+            *(generate() for _ in range(image_gen_executor._GENERATION_CONCURRENCY + 2))
+        )
+
+    asyncio.run(generate_many())
+    asyncio.run(generate_many())
+
+
+class _FailingStream(httpx.SyncByteStream):
+    """Response body that fails after its first chunk."""
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield one chunk, then time out."""
+        yield b"partial"
+        msg = "read timed out"
+        raise httpx.ReadTimeout(msg)
+
+
+class _AsyncFailingStream(httpx.AsyncByteStream):
+    """Async response body that fails after its first chunk."""
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yield one chunk, then time out."""
+        yield b"partial"
+        msg = "read timed out"
+        raise httpx.ReadTimeout(msg)
+
+
+@pytest.fixture
+def executor(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ImageGenExecutor:
+    """Create an image generation executor storing into a temporary FileStore."""
+    monkeypatch.setattr(
+        image_gen_executor,
+        "get_settings",
+        lambda: MagicMock(openai_api_key="test-key", openai_base_url="https://api.test.com"),
+    )
+    manifest = SkillManifest(
+        name="test-image-gen",
+        description="Test image generation",
+        runtime={"type": "service", "endpoint": "https://api.test.com", "timeout": 60},
+    )
+
+    executor = ImageGenExecutor(manifest)
+    executor._file_store = FileStore(tmp_path / "files")
+    return executor
+
+
+def _serve(
+    monkeypatch: pytest.MonkeyPatch, responses: list[httpx.Response | Exception]
+) -> list[str]:
+    """Serve canned responses to the executor's HTTP client, in order.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        responses: Responses to return, or exceptions to raise, per request.
+
+    Returns:
+        List that records the method of each request made.
+    """
+    methods: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(image_gen_executor, "get_client", lambda: client)
+    return methods
+
+
+def test_image_gen_retries_post_on_rate_limit(
+    executor: ImageGenExecutor, monkeypatch: pytest.MonkeyPatch, no_sleep: list[float]
+) -> None:
+    """Test that a rate-limited generation request is retried."""
+    methods = _serve(
+        monkeypatch,
+        [
+            httpx.Response(429, headers={"Retry-After": "1"}),
+            httpx.Response(200, json={"data": [{"url": IMAGE_URL}]}),
+            httpx.Response(200, content=b"image"),
+        ],
+    )
+
+    result = executor.execute(prompt="a cat")
+
+    assert methods == ["POST", "POST", "GET"]
+    assert no_sleep == [1.0]
+    assert "file_id: download-failed" not in result
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [httpx.Response(503), httpx.ReadTimeout("timed out")],
+    ids=["server-error", "timeout"],
+)
+def test_image_gen_does_not_retry_post_on_other_failures(
+    executor: ImageGenExecutor,
+    monkeypatch: pytest.MonkeyPatch,
+    no_sleep: list[float],
+    failure: httpx.Response | Exception,
+) -> None:
+    """Test that non-idempotent generation requests are not retried otherwise."""
+    methods = _serve(monkeypatch, [failure])
+
+    with pytest.raises(RuntimeError):
+        executor.execute(prompt="a cat")
+
+    assert methods == ["POST"]
+    assert no_sleep == []
+
+
+def test_failed_download_leaves_no_partial_file(
+    executor: ImageGenExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a download failing mid-stream is cleaned up before the retry."""
+    _serve(
+        monkeypatch,
+        [
+            httpx.Response(200, stream=_FailingStream()),
+            httpx.Response(200, content=b"image"),
+        ],
+    )
+
+    file_id = executor._download_and_store_image(IMAGE_URL)
+
+    file_store = executor._get_file_store()
+    assert file_store.retrieve(file_id) == b"image"
+    stored = [p for p in file_store.base_dir.rglob("*") if p.is_file() and p.suffix == ".png"]
+    assert stored == [file_store.path_for(file_id)]
+
+
+def test_async_failed_download_leaves_no_partial_file(
+    executor: ImageGenExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the async download streams into the store and cleans up on failure."""
+
+    async def fake_sleep(delay: float) -> None:
+        pass
+
+    monkeypatch.setattr(http.asyncio, "sleep", fake_sleep)
+    responses = [
+        httpx.Response(200, stream=_AsyncFailingStream()),
+        httpx.Response(200, content=b"image"),
+    ]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    async def download() -> str:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(image_gen_executor, "get_async_client", lambda: client)
+        async with client:
+            return await executor._adownload_and_store_image(IMAGE_URL)
+
+    file_id = asyncio.run(download())
+
+    file_store = executor._get_file_store()
+    assert file_store.retrieve(file_id) == b"image"
+    stored = [p for p in file_store.base_dir.rglob("*") if p.is_file() and p.suffix == ".png"]
+    assert stored == [file_store.path_for(file_id)]
+
+
+def test_custom_executor_uses_shared_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that sync service calls go through the pooled client."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"text": "done", "file_id": "f1"})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(custom_executor, "get_client", lambda: client)
+    manifest = SkillManifest(
+        name="custom",
+        description="Custom skill",
+        runtime={"type": "service", "endpoint": "https://svc.example.com/run"},
+    )
+
+    result = custom_executor.CustomExecutor(manifest).execute(query="hi")
+
+    assert result == "done\nfile_id: f1"
+    assert len(requests) == 1
+    assert requests[0].url == "https://svc.example.com/run"
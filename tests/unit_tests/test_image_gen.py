@@ -1,6 +1,6 @@
 """Test script for image generation skill."""
 
-import requests
+import httpx
 
 API_BASE = "http://localhost:8000"
 
@@ -17,11 +17,9 @@ def test_image_generation():
     print(f"   Thread ID: {request_data['thread_id']}\n")
 
     try:
-        response = requests.post(
-            f"{API_BASE}/api/chat",
-            json=request_data,
-            timeout=90,  # Image generation may take time
-        )
+        # Image generation may take time
+        with httpx.Client(base_url=API_BASE, timeout=90) as client:
+            response = client.post("/api/chat", json=request_data)
 
         print(f"📥 Response status: {response.status_code}\n")
 
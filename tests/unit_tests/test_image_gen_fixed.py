@@ -1,6 +1,7 @@
 """Test image generation executor with Settings integration."""
 
 import logging
+from contextlib import ExitStack
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -29,53 +30,68 @@ def test_image_gen_executor_uses_settings():
     }
     manifest = SkillManifest(**manifest_data)
 
-    # Create executor
-    executor = ImageGenExecutor(manifest)
-
-    # Mock settings to return test values
-    with patch("skillslike.executors.image_gen_executor.get_settings") as mock_get_settings:
-        mock_settings = MagicMock()
-        mock_settings.openai_api_key = "test-api-key-12345"
-        mock_settings.openai_base_url = "https://api.test.com"
-        mock_get_settings.return_value = mock_settings
-
-        # Mock httpx.post to avoid actual API call
-        with patch("skillslike.executors.image_gen_executor.httpx.post") as mock_post:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {
-                "data": [{"url": "https://example.com/image.png"}]
-            }
-            mock_post.return_value = mock_response
-
-            # Mock httpx.get for image download
-            with patch("skillslike.executors.image_gen_executor.httpx.get") as mock_get:
-                mock_img_response = MagicMock()
-                mock_img_response.content = b"fake-image-data"
-                mock_get.return_value = mock_img_response
-
-                # Mock FileStore
-                with patch(
-                    "skillslike.executors.image_gen_executor.FileStore"
-                ) as mock_file_store:
-                    mock_store_instance = MagicMock()
-                    mock_store_instance.store.return_value = "test-file-id-123"
-                    mock_file_store.return_value = mock_store_instance
-
-                    # Execute
-                    result = executor.execute(prompt="test prompt")
-
-                    # Verify Settings was called
-                    mock_get_settings.assert_called_once()
-
-                    # Verify API was called with correct key
-                    assert mock_post.called
-                    call_kwargs = mock_post.call_args
-                    assert call_kwargs.kwargs["headers"]["Authorization"] == "Bearer test-api-key-12345"
-                    assert "https://api.test.com/v1/images/generations" in call_kwargs.args[0]
-
-                    # Verify result contains file_id
-                    assert "file_id: test-file-id-123" in result
-                    print(f"✓ Test passed! Result: {result}")
+    module = "skillslike.executors.image_gen_executor"
+
+    with ExitStack() as stack:
+        # Mock settings to return test values
+        mock_get_settings = stack.enter_context(patch(f"{module}.get_settings"))
+        mock_get_settings.return_value = MagicMock(
+            openai_api_key="test-api-key-12345",
+            openai_base_url="https://api.test.com",
+        )
+
+        # Mock the shared HTTP client to avoid actual API calls
+        mock_client = stack.enter_context(patch(f"{module}.get_client")).return_value
+        mock_client.post.return_value.json.return_value = {
+            "data": [{"url": "https://example.com/image.png"}]
+        }
+
+        # Mock image download
+        mock_img_response = mock_client.stream.return_value.__enter__.return_value
+        mock_img_response.iter_bytes.return_value = iter([b"fake-image-data"])
+
+        # Mock FileStore
+        mock_file_store = stack.enter_context(patch(f"{module}.FileStore"))
+        mock_file_store.return_value.store_stream.return_value = "test-file-id-123"
+
+        # Create executor (credentials are resolved at construction) and execute
+        executor = ImageGenExecutor(manifest)
+        result = executor.execute(prompt="test prompt")
+
+    # Verify Settings was called
+    mock_get_settings.assert_called_once()
+
+    # Verify API was called with correct key
+    assert mock_client.post.called
+    call_kwargs = mock_client.post.call_args
+    assert call_kwargs.kwargs["headers"]["Authorization"] == "Bearer test-api-key-12345"
+    assert "https://api.test.com/v1/images/generations" in call_kwargs.args[0]
+
+    # Verify result contains file_id
+    assert "file_id: test-file-id-123" in result
+    print(f"✓ Test passed! Result: {result}")
+
+
+def test_image_gen_executor_reuses_file_store():
+    """Test that one FileStore is opened per executor, not per stored image."""
+    manifest = SkillManifest(
+        name="test-image-gen",
+        description="Test image generation",
+        runtime={"type": "service", "endpoint": "https://api.test.com", "timeout": 60},
+    )
+
+    with patch("skillslike.executors.image_gen_executor.FileStore") as mock_file_store:
+        mock_file_store.return_value.store.return_value = "test-file-id"
+        executor = ImageGenExecutor(manifest)
+
+        # Nothing is opened until an image is stored
+        mock_file_store.assert_not_called()
+
+        assert executor._store_base64_image("aGVsbG8=") == "test-file-id"
+        assert executor._store_base64_image("d29ybGQ=") == "test-file-id"
+
+    mock_file_store.assert_called_once_with()
+    assert mock_file_store.return_value.store.call_count == 2
 
 
 def test_settings_loads_from_env():
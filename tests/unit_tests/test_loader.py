@@ -1,5 +1,7 @@
 """Unit tests for manifest loader."""
 
+import os
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -10,10 +12,11 @@ from skillslike.registry.loader import ManifestLoader
 
 
 @pytest.fixture
-def temp_skills_dir() -> Path:
+def temp_skills_dir(request: pytest.FixtureRequest) -> Path:
     """Create a temporary directory for test manifests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    tmpdir = Path(tempfile.mkdtemp())
+    request.addfinalizer(lambda: shutil.rmtree(tmpdir, ignore_errors=True))
+    return tmpdir
 
 
 @pytest.fixture
@@ -60,6 +63,25 @@ def test_load_manifest(sample_manifest: Path, temp_skills_dir: Path) -> None:
     assert manifest.runtime.type == RuntimeType.SERVICE
 
 
+def test_load_manifest_cached_until_modified(
+    sample_manifest: Path, temp_skills_dir: Path
+) -> None:
+    """Test that unchanged manifests are reused and modified ones re-parsed."""
+    loader = ManifestLoader(temp_skills_dir)
+    first = loader.load_manifest(sample_manifest)
+
+    assert loader.load_manifest(sample_manifest) is first
+
+    sample_manifest.write_text(sample_manifest.read_text().replace("A test skill", "Updated"))
+    stat = sample_manifest.stat()
+    os.utime(sample_manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    updated = loader.load_manifest(sample_manifest)
+
+    assert updated is not first
+    assert updated.description == "Updated"
+
+
 def test_load_all_manifests(sample_manifest: Path, temp_skills_dir: Path) -> None:
     """Test loading all manifests from a directory."""
     loader = ManifestLoader(temp_skills_dir)
@@ -69,6 +91,19 @@ def test_load_all_manifests(sample_manifest: Path, temp_skills_dir: Path) -> Non
     assert manifests[0].name == "test-skill"
 
 
+def test_load_all_many_manifests(temp_skills_dir: Path) -> None:
+    """Test loading a directory of many manifests."""
+    for i in range(10):
+        (temp_skills_dir / f"skill-{i}.yaml").write_text(
+            f"name: skill-{i}\ndescription: Skill {i}\nruntime:\n  type: service\n"
+        )
+
+    loader = ManifestLoader(temp_skills_dir)
+    manifests = loader.load_all()
+
+    assert sorted(m.name for m in manifests) == sorted(f"skill-{i}" for i in range(10))
+
+
 def test_load_all_empty_directory(temp_skills_dir: Path) -> None:
     """Test loading from an empty directory."""
     loader = ManifestLoader(temp_skills_dir)
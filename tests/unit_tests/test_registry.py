@@ -0,0 +1,42 @@
+"""Unit tests for the skill registry."""
+
+from pathlib import Path
+
+from skillslike.registry import SkillRegistry
+
+
+def _write_skill(skills_dir: Path, name: str, description: str) -> None:
+    """Write a minimal service skill manifest.
+
+    Args:
+        skills_dir: Directory to write the manifest to.
+        name: Skill name, also used as the file name.
+        description: Skill description.
+    """
+    (skills_dir / f"{name}.yaml").write_text(
+        f"name: {name}\ndescription: {description}\nruntime:\n  type: service\n"
+    )
+
+
+def test_reloaded_returns_new_registry(tmp_path: Path) -> None:
+    """Test that reloading builds a new registry and leaves the old one intact."""
+    _write_skill(tmp_path, "kept", "Kept skill")
+    _write_skill(tmp_path, "changed", "Old description")
+    registry = SkillRegistry(tmp_path)
+    kept_tool = registry.get_tool("kept")
+    registry.get_tool("changed")
+
+    _write_skill(tmp_path, "changed", "New, longer description")
+    _write_skill(tmp_path, "added", "Added skill")
+    reloaded = registry.reloaded()
+
+    # Readers of the old registry still see a consistent snapshot
+    assert sorted(registry.manifests) == ["changed", "kept"]
+    assert registry.manifests["changed"].description == "Old description"
+    assert sorted(registry.tools) == ["changed", "kept"]
+
+    assert sorted(reloaded.manifests) == ["added", "changed", "kept"]
+    assert reloaded.manifests["changed"].description == "New, longer description"
+    # Only the tool for the unchanged manifest is carried over
+    assert reloaded.tools == {"kept": kept_tool}
+    assert reloaded.get_tool("changed").description == "New, longer description"
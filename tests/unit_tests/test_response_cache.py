@@ -0,0 +1,43 @@
+"""Unit tests for the chat response cache."""
+
+from skillslike.api.cache import ResponseCache
+
+
+def test_cache_hit_normalizes_message() -> None:
+    """Test that case and whitespace differences share a cache entry."""
+    cache = ResponseCache()
+    cache.put("Analyze   sales data", {"text": "done", "file_ids": ["f1"]})
+
+    cached = cache.get("analyze sales DATA ")
+
+    assert cached == {"text": "done", "file_ids": ["f1"]}
+
+
+def test_cache_miss() -> None:
+    """Test lookup of an uncached message."""
+    cache = ResponseCache()
+
+    assert cache.get("hello") is None
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Test that the cache respects max_size with LRU eviction."""
+    cache = ResponseCache(max_size=2)
+    cache.put("a", {"text": "a", "file_ids": []})
+    cache.put("b", {"text": "b", "file_ids": []})
+
+    # Touch "a" so "b" becomes the eviction candidate
+    cache.get("a")
+    cache.put("c", {"text": "c", "file_ids": []})
+
+    assert len(cache) == 2
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+
+
+def test_cache_disabled() -> None:
+    """Test that max_size=0 disables caching."""
+    cache = ResponseCache(max_size=0)
+    cache.put("a", {"text": "a", "file_ids": []})
+
+    assert cache.get("a") is None
@@ -57,16 +57,25 @@ def test_router_initialization(sample_manifests: list[SkillManifest]) -> None:
     assert "web-search" in router.keyword_index
 
 
+def test_keyword_index_precomputed(sample_manifests: list[SkillManifest]) -> None:
+    """Test that each skill's keywords are built once as a frozenset at init."""
+    router = IntentRouter(sample_manifests)
+
+    keywords = router.keyword_index["web-search"]
+
+    assert isinstance(keywords, frozenset)
+    # Description keywords and tags are both indexed
+    assert keywords == {"search", "web", "information"}
+    assert router.keyword_sizes["web-search"] == len(keywords)
+
+
 def test_keyword_extraction() -> None:
     """Test keyword extraction from text."""
     router = IntentRouter([])
 
     keywords = router._extract_keywords("Analyze the Excel spreadsheet data")
 
-    assert "analyze" in keywords
-    assert "excel" in keywords
-    assert "spreadsheet" in keywords
-    assert "data" in keywords
+    assert {"analyze", "excel", "spreadsheet", "data"} <= keywords
 
 
 def test_keyword_extraction_chinese() -> None:
@@ -80,14 +89,7 @@ def test_keyword_extraction_chinese() -> None:
     keywords = router._extract_keywords("分析这个表格数据")
 
     # Current implementation extracts individual Chinese characters
-    assert "分" in keywords
-    assert "析" in keywords
-    assert "表" in keywords
-    assert "格" in keywords
-    assert "数" in keywords
-    assert "据" in keywords
-    # Verify keywords were extracted
-    assert len(keywords) > 0
+    assert {"分", "析", "表", "格", "数", "据"} <= keywords
 
 
 def test_route_tools_exact_match(
@@ -103,6 +105,97 @@ def test_route_tools_exact_match(
     assert any(tool.name == "excel_skill" for tool in selected)
 
 
+def test_score_all_matches_jaccard(sample_manifests: list[SkillManifest]) -> None:
+    """Test that inverted-index scores equal per-skill Jaccard scores."""
+    router = IntentRouter(sample_manifests)
+    user_keywords = router._extract_keywords("Analyze Excel data and search the web")
+
+    scores = router._score_all(user_keywords)
+
+    assert set(scores) == {"excel-skill", "web-search"}
+    for skill_name, score in scores.items():
+        assert score == pytest.approx(router._score_skill(skill_name, user_keywords))
+
+
+def test_score_all_prunes_by_size_bound() -> None:
+    """Test that skills whose Jaccard upper bound is below threshold are skipped."""
+    runtime = RuntimeConfig(type=RuntimeType.SERVICE, endpoint="http://test")
+    manifests = [
+        SkillManifest(name="small", description="excel", runtime=runtime),
+        SkillManifest(
+            name="large",
+            description="excel charts pivot tables formulas macros reports",
+            runtime=runtime,
+        ),
+    ]
+    router = IntentRouter(manifests, match_threshold=0.5)
+
+    scores = router._score_all(router._extract_keywords("excel"))
+
+    # "large" shares a keyword but can score at most 1/7
+    assert set(scores) == {"small"}
+
+
+def test_score_all_keeps_score_equal_to_threshold() -> None:
+    """Test that size pruning keeps skills whose score equals the threshold."""
+    # 0.14 * 50 == 7.000000000000001 in floating point
+    words = [f"word{chr(97 + i // 26)}{chr(97 + i % 26)}" for i in range(50)]
+    runtime = RuntimeConfig(type=RuntimeType.SERVICE, endpoint="http://test")
+    manifests = [
+        SkillManifest(name="subset", description=" ".join(words[:7]), runtime=runtime)
+    ]
+    router = IntentRouter(manifests, match_threshold=0.14)
+    user_keywords = router._extract_keywords(" ".join(words))
+    assert len(user_keywords) == 50
+
+    scores = router._score_all(user_keywords)
+
+    assert scores == {"subset": pytest.approx(0.14)}
+    assert router._score_skill("subset", user_keywords) >= router.match_threshold
+
+
+def test_score_all_matches_brute_force_at_boundaries() -> None:
+    """Test pruning against per-skill scoring for many threshold/size combinations."""
+    runtime = RuntimeConfig(type=RuntimeType.SERVICE, endpoint="http://test")
+    words = [f"word{chr(97 + i // 26)}{chr(97 + i % 26)}" for i in range(30)]
+    manifests = [
+        SkillManifest(name=f"size-{n}", description=" ".join(words[:n]), runtime=runtime)
+        for n in range(1, 31)
+    ]
+
+    for num_user in range(1, 31):
+        for threshold in (0.1, 0.14, 0.2, 0.25, 0.3, 1 / 3, 0.5, 0.7, 1.0):
+            router = IntentRouter(manifests, match_threshold=threshold)
+            user_keywords = router._extract_keywords(" ".join(words[:num_user]))
+
+            scores = router._score_all(user_keywords)
+
+            expected = {
+                m.name
+                for m in manifests
+                if router._score_skill(m.name, user_keywords) >= threshold
+            }
+            assert expected <= set(scores)
+
+
+def test_route_tools_uses_skill_name_metadata(sample_manifests: list[SkillManifest]) -> None:
+    """Test that tool metadata maps tools to skills regardless of tool name."""
+    router = IntentRouter(sample_manifests, match_threshold=0.1, max_tools=1)
+    unrelated = StructuredTool.from_function(
+        func=lambda: "result", name="unrelated", description="Other"
+    )
+    tool = StructuredTool.from_function(
+        func=lambda: "result",
+        name="spreadsheets",
+        description="Excel",
+        metadata={"skill_name": "excel-skill"},
+    )
+
+    selected = router.route_tools("Analyze Excel spreadsheet", [unrelated, tool])
+
+    assert selected == [tool]
+
+
 def test_route_tools_no_keywords(
     sample_manifests: list[SkillManifest], sample_tools: list[StructuredTool]
 ) -> None:
@@ -130,8 +223,6 @@ def test_get_skill_keywords(sample_manifests: list[SkillManifest]) -> None:
     """Test retrieving keywords for a specific skill."""
     router = IntentRouter(sample_manifests)
 
-    keywords = router.get_skill_keywords("excel-skill")
+    keywords = set(router.get_skill_keywords("excel-skill"))
 
-    assert "excel" in keywords
-    assert "data" in keywords
-    assert "spreadsheet" in keywords
+    assert {"excel", "data", "spreadsheet"} <= keywords